@@ -3,17 +3,31 @@ import re
 import os
 import logging
 import shutil
+import threading
 import requests
 import json
-from bs4 import BeautifulSoup
+import base64
+import unicodedata
 from datetime import datetime, time
 from flask import Flask, jsonify, request
 from flasgger import Swagger
 from urllib.parse import urlparse
 from werkzeug.utils import secure_filename
 from flask_cors import CORS
-from scraper.liquipedia_scraper import fetch_tournaments, get_matches_by_status
+from scraper import liquipedia_scraper
+from scraper.liquipedia_scraper import fetch_tournaments, get_matches_by_status, cached_game_slugs, seconds_until_stale
+from scraper.page_snapshot import get_page_soup
+from scraper.parsing import make_soup, EWC_PAGE_AREAS, GROUP_STAGE_AREAS, LINKS
+from scraper.fanout import fan_out
+from scraper.json_cache import load_json, LRUCache
+from scraper.scheduler import RefreshScheduler
+from scraper.singleflight import SingleFlight
+from scraper.refresh_policy import adaptive_interval
+from scraper.group_stage import parse_group_stage, MatchRecord
+from scraper.match_time import parse_match_time, match_timestamp, UNKNOWN_MATCH_TIME, UNKNOWN_MATCH_DATE
+from scraper import http_client
 from collections import defaultdict
+from functools import lru_cache, wraps
 from datetime import datetime as dt
 
 # Configure logging
@@ -24,20 +38,121 @@ logger = logging.getLogger(__name__)
 UPLOAD_FOLDER = 'static/uploads'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
+# Main EWC page; info, teams, events, prizes and games are all read from one snapshot of it
+EWC_URL = "https://liquipedia.net/esports/Esports_World_Cup/2025"
+
+# How scraped data is refreshed: 'request' scrapes when a client asks for it (live=true or
+# an empty table), 'thread' runs the refresh scheduler inside the web process and 'worker'
+# leaves it to worker.py. With a scheduler, request handlers read stored data; the only scrape
+# left in a request is the first tournaments or matches read of a slug that has no cache file yet.
+REFRESH_MODE = os.environ.get('REFRESH_MODE', 'request')
+PRECOMPUTED = REFRESH_MODE in ('thread', 'worker')
+
+# /api/ewc_matches* scrape a game's group stage at most once per GROUP_STAGE_CACHE_TTL seconds and
+# answer from the match store in between; the scrape times of GROUP_STAGE_CACHE_SIZE games are kept
+GROUP_STAGE_CACHE_TTL = int(os.environ.get('GROUP_STAGE_CACHE_TTL', 60))
+GROUP_STAGE_CACHE_SIZE = int(os.environ.get('GROUP_STAGE_CACHE_SIZE', 64))
+
+# Scheduler intervals in seconds. Pages with matches are polled every REFRESH_LIVE_INTERVAL
+# around their matches and back off up to REFRESH_IDLE_INTERVAL in between.
+REFRESH_EWC_PAGE_INTERVAL = int(os.environ.get('REFRESH_EWC_PAGE_INTERVAL', 3600))
+REFRESH_LIVE_INTERVAL = int(os.environ.get('REFRESH_LIVE_INTERVAL', 30))
+REFRESH_IDLE_INTERVAL = int(os.environ.get('REFRESH_IDLE_INTERVAL', 6 * 3600))
+REFRESH_LIQUIPEDIA_INTERVAL = int(os.environ.get('REFRESH_LIQUIPEDIA_INTERVAL', 600))
+# How often worker.py looks for refreshes asked for by web processes (live=true, force=true)
+REFRESH_REQUEST_POLL_INTERVAL = float(os.environ.get('REFRESH_REQUEST_POLL_INTERVAL', 2))
+# Game slugs whose tournaments and matches are kept fresh before anyone asks for them
+REFRESH_GAME_SLUGS = [slug for slug in os.environ.get('REFRESH_GAME_SLUGS', '').split(',') if slug]
+
+# A match counts as live from MATCH_LEAD_TIME before its start until MATCH_LIVE_WINDOW after it
+MATCH_LEAD_TIME = 15 * 60
+MATCH_LIVE_WINDOW = 3 * 3600
+
+# Natural key of each scraped EWC table, used by sync_table() to upsert refreshes in place
+NATURAL_KEYS = {
+    'teams': 'team_name',
+    'events': 'name',
+    'games': 'game_name',
+    'prize_distribution': 'place',
+}
+
+# Set by init_db(); news search uses LIKE when SQLite was built without FTS5
+news_fts_enabled = False
+
+# SQLite database; every thread reuses one connection opened by get_db()
+DATABASE = os.environ.get('DATABASE_PATH', 'news.db')
+DB_BUSY_TIMEOUT = float(os.environ.get('DB_BUSY_TIMEOUT', 5))
+DB_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',      # readers no longer block on writers
+    'PRAGMA synchronous=NORMAL',    # safe with WAL, fsync only at checkpoints
+    'PRAGMA cache_size=-20000',     # ~20 MiB page cache per connection
+    'PRAGMA mmap_size=268435456',   # map up to 256 MiB of the file
+    'PRAGMA temp_store=MEMORY',
+)
+
+_db_local = threading.local()
+
+def get_db():
+    """Return this thread's SQLite connection, opening and tuning it on first use"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE, timeout=DB_BUSY_TIMEOUT)
+        for pragma in DB_PRAGMAS:
+            conn.execute(pragma)
+        _db_local.conn = conn
+    elif conn.in_transaction:
+        # Never hand out a transaction a failed caller left open
+        conn.rollback()
+    return conn
+
+def release_db(exception=None):
+    """Roll back whatever the request left uncommitted; the connection stays open for reuse"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def init_db():
-    """Initialize the SQLite database with news, teams, events, and ewc_info tables"""
-    conn = sqlite3.connect('news.db')
-    cursor = conn.cursor()
+    """Bring the SQLite database up to the current schema version"""
+    global news_fts_enabled
+    conn = get_db()
     
     # Create uploads directory if it doesn't exist
     if not os.path.exists(UPLOAD_FOLDER):
         os.makedirs(UPLOAD_FOLDER)
-    
+
+    migrate_db(conn)
+
+    cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='news_fts'")
+    news_fts_enabled = cursor.fetchone() is not None
+
+def migrate_db(conn):
+    """Apply each step of MIGRATIONS the database has not seen yet, one transaction per step
+
+    The schema version is kept in PRAGMA user_version, so an up-to-date database costs one read.
+    """
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    for target, migration in enumerate(MIGRATIONS, start=1):
+        if version >= target:
+            continue
+        # IMMEDIATE takes the write lock up front; re-read the version in case another process won the race
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] < target:
+                migration(conn.cursor())
+                conn.execute(f'PRAGMA user_version = {target}')
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        logger.info(f"Database migrated to version {target} ({migration.__name__})")
+
+def create_base_tables(cursor):
+    """Create news, prize_distribution, teams, events, games and ewc_info, upgrading a legacy news table"""
     # Check and create news table
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='news'")
     table_exists = cursor.fetchone()
@@ -142,13 +257,321 @@ def init_db():
         )
     ''')
 
-    conn.commit()
-    conn.close()
+def create_match_store(cursor):
+    """Create the match store: one row per group stage match, plus per-game scrape status"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS match_games (
+            game_slug TEXT PRIMARY KEY,
+            game TEXT NOT NULL COLLATE NOCASE,
+            message TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_slug TEXT NOT NULL,
+            game TEXT NOT NULL COLLATE NOCASE,
+            group_name TEXT NOT NULL COLLATE NOCASE,
+            position INTEGER NOT NULL,
+            team1_name TEXT,
+            team1_logo TEXT,
+            team2_name TEXT,
+            team2_logo TEXT,
+            score TEXT,
+            match_time_text TEXT,
+            match_time INTEGER NOT NULL,
+            match_date TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (game_slug, group_name, position)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_matches_time ON matches (match_time, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_matches_game_time ON matches (game, match_time)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_matches_group_time ON matches (group_name, match_time)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_matches_date_time ON matches (match_date, match_time)')
+
+def create_news_indexes(cursor):
+    """Index news for every listing order and writer filter of get_news"""
+    # Keyset pagination seeks on these instead of skipping OFFSET rows
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_created ON news (created_at, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_title ON news (title, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_writer_created ON news (writer, created_at, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_writer_title ON news (writer, title, id)')
+
+def create_news_search(cursor):
+    """Create the FTS5 index over news and the triggers that keep it in sync"""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='news_fts'")
+    fts_exists = cursor.fetchone() is not None
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                title, description, writer,
+                content='news', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        logger.warning(f"FTS5 unavailable, news search falls back to LIKE: {str(e)}")
+        return
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_insert AFTER INSERT ON news BEGIN
+            INSERT INTO news_fts (rowid, title, description, writer)
+            VALUES (new.id, new.title, new.description, new.writer);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_delete AFTER DELETE ON news BEGIN
+            INSERT INTO news_fts (news_fts, rowid, title, description, writer)
+            VALUES ('delete', old.id, old.title, old.description, old.writer);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_update AFTER UPDATE OF title, description, writer ON news BEGIN
+            INSERT INTO news_fts (news_fts, rowid, title, description, writer)
+            VALUES ('delete', old.id, old.title, old.description, old.writer);
+            INSERT INTO news_fts (rowid, title, description, writer)
+            VALUES (new.id, new.title, new.description, new.writer);
+        END
+    ''')
+    if not fts_exists:
+        # Rank title hits above description and writer hits
+        cursor.execute("INSERT INTO news_fts (news_fts, rank) VALUES ('rank', 'bm25(10.0, 2.0, 1.0)')")
+        # Index news written before the search table existed
+        cursor.execute("INSERT INTO news_fts (news_fts) VALUES ('rebuild')")
+
+def create_news_counts(cursor):
+    """Create the per-writer news counters and the triggers that keep them current"""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='news_writer_counts'")
+    counts_exist = cursor.fetchone() is not None
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS news_writer_counts (
+            writer TEXT PRIMARY KEY,
+            total INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_counts_insert AFTER INSERT ON news BEGIN
+            INSERT INTO news_writer_counts (writer, total) VALUES (new.writer, 1)
+            ON CONFLICT(writer) DO UPDATE SET total = total + 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_counts_delete AFTER DELETE ON news BEGIN
+            UPDATE news_writer_counts SET total = total - 1 WHERE writer = old.writer;
+            DELETE FROM news_writer_counts WHERE writer = old.writer AND total <= 0;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_counts_update AFTER UPDATE OF writer ON news
+        WHEN new.writer IS NOT old.writer BEGIN
+            UPDATE news_writer_counts SET total = total - 1 WHERE writer = old.writer;
+            DELETE FROM news_writer_counts WHERE writer = old.writer AND total <= 0;
+            INSERT INTO news_writer_counts (writer, total) VALUES (new.writer, 1)
+            ON CONFLICT(writer) DO UPDATE SET total = total + 1;
+        END
+    ''')
+    if not counts_exist:
+        cursor.execute('INSERT INTO news_writer_counts (writer, total) SELECT writer, COUNT(*) FROM news GROUP BY writer')
+
+def add_natural_keys(cursor):
+    """Give the scraped EWC tables a unique natural key and a page position for sync_table()"""
+    for table, key in NATURAL_KEYS.items():
+        cursor.execute(f'PRAGMA table_info({table})')
+        if 'position' not in {col[1] for col in cursor.fetchall()}:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN position INTEGER')
+        # Keep the first copy of any duplicate so the unique index can be built
+        cursor.execute(f'DELETE FROM {table} WHERE id NOT IN (SELECT MIN(id) FROM {table} GROUP BY {key})')
+        # Number the surviving rows 0..n-1 in their current order, as sync_table() does
+        cursor.execute(f'UPDATE {table} SET position = (SELECT COUNT(*) FROM {table} AS o WHERE o.id < {table}.id)')
+        cursor.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS idx_{table}_{key} ON {table} ({key})')
+
+def recompute_match_times(cursor):
+    """Re-derive stored match times from their text, now read in the page's time zone instead of UTC"""
+    cursor.execute('SELECT DISTINCT match_time_text FROM matches')
+    cursor.executemany(
+        'UPDATE matches SET match_time = ?, match_date = ? WHERE match_time_text IS ?',
+        [parse_match_time(row[0]) + (row[0],) for row in cursor.fetchall()]
+    )
+
+def create_refresh_requests(cursor):
+    """Create the queue through which web processes ask worker.py to run a refresh job now"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS refresh_requests (
+            job TEXT PRIMARY KEY,
+            requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+# Schema steps in order; a step's position is the schema version it brings the database to.
+# Append new steps only, never edit or reorder applied ones.
+MIGRATIONS = [
+    create_base_tables,
+    create_match_store,
+    create_news_indexes,
+    create_news_search,
+    create_news_counts,
+    add_natural_keys,
+    recompute_match_times,
+    create_refresh_requests,
+]
+
+def fold_words(text):
+    """Lower-cased, accent-free words of text, split the way the news_fts tokenizer splits them"""
+    text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+    return re.findall(r'[^\W_]+', text.casefold())
+
+def matching_writers(writer):
+    """Writers whose name contains every word of the filter as a word prefix, with their news counts
+
+    Returns None when the filter has no words or FTS5 is missing, in which case news_filters() uses LIKE.
+    """
+    words = fold_words(writer)
+    if not words or not news_fts_enabled:
+        return None
+    conn = get_db()
+    writers = {}
+    for name, count in conn.execute('SELECT writer, total FROM news_writer_counts'):
+        name_words = fold_words(name)
+        if all(any(name_word.startswith(word) for name_word in name_words) for word in words):
+            writers[name] = count
+    return writers
+
+def stored_news_total(writer, search):
+    """Number of news matching the filters, read from news_writer_counts, or None if the counters cannot tell"""
+    if search:
+        return None
+    if not writer:
+        conn = get_db()
+        return conn.execute('SELECT COALESCE(SUM(total), 0) FROM news_writer_counts').fetchone()[0]
+    writers = matching_writers(writer)
+    return None if writers is None else sum(writers.values())
+
+def encode_cursor(sort, *key):
+    """Opaque next_cursor token for the sort key of the last row of a page, tagged with the sort it follows"""
+    return base64.urlsafe_b64encode(json.dumps([sort, *key], separators=(',', ':')).encode()).decode().rstrip('=')
+
+def decode_cursor(token, sort, types):
+    """Sort key list stored in a cursor token made by encode_cursor(sort, ...) with one value of each type
+
+    Raises ValueError for anything else, including a cursor issued for another sort.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if not isinstance(key, list) or len(key) != len(types) + 1:
+        raise ValueError(f"Invalid cursor: {token}")
+    if key[0] != sort:
+        raise ValueError(f"Cursor was issued for a different sort than {sort}")
+    # bool is an int subclass but never part of a sort key
+    if any(type(value) is bool or not isinstance(value, kind) for value, kind in zip(key[1:], types)):
+        raise ValueError(f"Invalid cursor: {token}")
+    return key[1:]
+
+def fts_prefix_query(text):
+    """FTS5 query matching every word of text as a prefix, or None when text has no words"""
+    words = re.findall(r'[^\W_]+', text)
+    if not words:
+        return None
+    return ' AND '.join(f'"{word}"*' for word in words)
+
+# Most writers read as one UNION ALL branch each (SQLite allows 500 terms in a compound SELECT);
+# a filter matching more of them uses IN (...) and sorts the matching news
+WRITER_BRANCHES_MAX = 64
+
+def news_filters(writer, search):
+    """FROM/WHERE clause and parameters selecting the news matching the writer and search filters"""
+    source = 'news'
+    where = ['1=1']
+    params = []
+
+    # Writer names are resolved on the small counter table so the filter can use idx_news_writer_*
+    writers = matching_writers(writer) if writer else None
+    search_query = fts_prefix_query(search) if search and news_fts_enabled else None
+
+    if writers is not None:
+        if len(writers) == 1:
+            # Equality rather than a one-value IN lets SQLite read the index in ORDER BY order
+            where.append('news.writer = ?')
+        elif 1 < len(writers) <= WRITER_BRANCHES_MAX and not search_query:
+            # SQLite cannot read IN (...) in index order; one indexed branch per writer is merged
+            # in ORDER BY order instead of sorting every news of those writers
+            source = '(' + ' UNION ALL '.join('SELECT * FROM news WHERE writer = ?' for _ in writers) + ') AS news'
+        else:
+            where.append(f"news.writer IN ({', '.join('?' for _ in writers)})" if writers else '0')
+        params.extend(writers)
+    elif writer:
+        where.append('news.writer LIKE ?')
+        params.append(f'%{writer}%')
+    if search_query:
+        source = 'news JOIN news_fts ON news_fts.rowid = news.id'
+        where.append('news_fts MATCH ?')
+        params.append(f'{{title description}} : ({search_query})')
+    elif search:
+        where.append('(news.title LIKE ? OR news.description LIKE ?)')
+        params.extend([f'%{search}%', f'%{search}%'])
+
+    return source, ' AND '.join(where), params
+
+def news_page_query(filters, sort, after=None):
+    """SELECT of one page of news_filters() results in sort order, past the cursor key after
+
+    Returns the query and its parameters; LIMIT and OFFSET are bound after them.
+    """
+    source, where, params = filters
+    if sort == 'relevance' and 'news_fts' in source:
+        order_by = 'news_fts.rank, news.created_at DESC, news.id DESC'
+    else:
+        sort_column = 'created_at' if sort == 'relevance' else sort
+        order_by = f'news.{sort_column} DESC, news.id DESC'
+
+    params = list(params)
+    if after:
+        where += f' AND (news.{sort}, news.id) < (?, ?)'
+        params.extend(after)
+
+    query = f'''
+        SELECT news.id, news.title, news.description, news.writer, news.thumbnail_url,
+               news.news_link, news.created_at, news.updated_at
+        FROM {source} WHERE {where}
+        ORDER BY {order_by} LIMIT ? OFFSET ?
+    '''
+    return query, params
+
+def sync_table(table, columns, items):
+    """Make table hold exactly items, in order, writing only the rows that changed
+
+    Rows are matched on the natural key NATURAL_KEYS[table], which must be the first of columns.
+    Everything happens in one transaction, so readers see either the old or the new list.
+    Returns the number of upserted and deleted rows.
+    """
+    key = NATURAL_KEYS[table]
+    wanted = {}
+    for item in items:
+        values = tuple(item[column] for column in columns)
+        wanted.setdefault(values[0], values + (len(wanted),))
+
+    conn = get_db()
+    select_columns = ', '.join(columns)
+    existing = {row[0]: row for row in conn.execute(f'SELECT {select_columns}, position FROM {table}')}
+    changed = [row for row_key, row in wanted.items() if existing.get(row_key) != row]
+    stale = [(row_key,) for row_key in existing if row_key not in wanted]
+
+    updates = ', '.join(f'{column} = excluded.{column}' for column in columns[1:] + ['position'])
+    placeholders = ', '.join('?' for _ in range(len(columns) + 1))
+    with conn:
+        conn.executemany(f'''
+            INSERT INTO {table} ({select_columns}, position) VALUES ({placeholders})
+            ON CONFLICT({key}) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP
+        ''', changed)
+        conn.executemany(f'DELETE FROM {table} WHERE {key} = ?', stale)
+    return len(changed), len(stale)
 
 def reset_db_sequence():
     """Reset the SQLite sequence for all tables"""
     try:
-        conn = sqlite3.connect('news.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM sqlite_sequence WHERE name IN ('news', 'teams', 'events', 'ewc_info')")
         conn.commit()
@@ -156,32 +579,26 @@ def reset_db_sequence():
     except sqlite3.Error as e:
         logger.error(f"Failed to reset SQLite sequence: {str(e)}")
         raise
-    finally:
-        conn.close()
 
+URL_PATTERN = re.compile(
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
 def is_valid_url(url):
     """Validate URL format"""
     if not url:
         return True
-    regex = re.compile(
-        r'^https?://'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-        r'localhost|'
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-        r'(?::\d+)?'
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    return bool(regex.match(url))
+    return URL_PATTERN.match(url) is not None
 
 def is_valid_thumbnail(url):
     """Validate thumbnail URL (image or link)"""
-    if not url:
-        return True
-    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
-    parsed = urlparse(url)
-    return is_valid_url(url) and (
-        parsed.path.lower().endswith(image_extensions) or 
-        parsed.scheme in ('http', 'https')
-    )
+    # URL_PATTERN only accepts http(s) links, which are valid thumbnails whatever their extension
+    return is_valid_url(url)
 
 def is_valid_date(date_str):
     """Validate date format (YYYY-MM-DD)"""
@@ -191,32 +608,58 @@ def is_valid_date(date_str):
     except ValueError:
         return False
 
-def parse_match_datetime(match_time):
-    """Parse match time string to datetime for sorting by date and time"""
-    try:
-        if ' - ' in match_time:
-            date_str, time_str = match_time.split(' - ')
-            date_str = ' '.join(date_str.split()[:3])  # Take first three words (e.g., "July 8, 2025")
-            time_str = time_str.split()[0]  # Take time part (e.g., "12:00")
-            parsed_datetime = dt.strptime(f"{date_str} {time_str}", '%B %d, %Y %H:%M')
-            return parsed_datetime
-        else:
-            # Handle cases like "August 2, 2025" without time
-            date_str = ' '.join(match_time.split()[:3])
-            parsed_datetime = dt.strptime(date_str, '%B %d, %Y')
-            return parsed_datetime
-    except (IndexError, ValueError):
-        return dt.max
+def game_slug_of(link):
+    """Liquipedia wiki slug of a game link, e.g. 'dota2' for https://liquipedia.net/dota2/..."""
+    return urlparse(link).path.strip('/').split('/')[0]
+
+# Start of the message scrape_group_stage returns for a game without a group stage page
+NOT_FOUND_PREFIX = 'Failed to fetch data: '
 
+def is_not_found_result(match_data):
+    """Whether a scrape_group_stage result is the error for a game without a group stage page"""
+    return isinstance(match_data, dict) and "message" in match_data and "404 Client Error" in match_data["message"]
+
+def load_events_json():
+    """Load events_ewc.json, fetching and saving the events from Liquipedia when the file is missing"""
+    try:
+        games = load_json('events_ewc.json')
+        logger.debug("Retrieved events data from events_ewc.json")
+        return games
+    except FileNotFoundError:
+        logger.warning("events_ewc.json not found, fetching events from Liquipedia")
+
+    games = get_events_ewc(live=True)
+    if games:
+        # Save fetched events to JSON file for future caching
+        try:
+            with open('events_ewc.json', 'w', encoding='utf-8') as f:
+                json.dump(games, f, ensure_ascii=False, indent=2)
+            logger.debug("Saved events data to events_ewc.json")
+        except Exception as e:
+            logger.error(f"Error saving events_ewc.json: {str(e)}")
+    return games
+
+# Concurrent identical scrapes, keyed by (operation, game slug or params), run once and share the result
+scrape_flight = SingleFlight()
+
+def coalesce_live(extractor):
+    """Let concurrent live calls of an EWC page extractor share one scrape"""
+    @wraps(extractor)
+    def wrapper(live=False):
+        if not live:
+            return extractor(live=False)
+        return scrape_flight.do((extractor.__name__,), lambda: extractor(live=True))
+    return wrapper
+
+@coalesce_live
 def get_ewc_information(live=False):
     """Fetch Esports World Cup 2025 information from Liquipedia or database"""
     if not live:
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM ewc_info ORDER BY updated_at DESC LIMIT 1')
             row = cursor.fetchone()
-            conn.close()
             
             if row:
                 info_data = {
@@ -238,18 +681,15 @@ def get_ewc_information(live=False):
                 return info_data
         except sqlite3.Error as e:
             logger.error(f"Database error while fetching EWC info: {str(e)}")
+        if PRECOMPUTED:
+            # Not scraped by the scheduler yet; requests never scrape themselves
+            return {}
     
     # Fetch from Liquipedia if live=True or no data in database
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
-    URL = "https://liquipedia.net/esports/Esports_World_Cup/2025"
     
     try:
-        response = requests.get(URL, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
         info_data = soup.select_one('div.fo-nttax-infobox')
         
         data = {}
@@ -295,7 +735,7 @@ def get_ewc_information(live=False):
         
         # Store in database
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('DELETE FROM ewc_info')  # Clear existing info
             cursor.execute('''
@@ -323,8 +763,6 @@ def get_ewc_information(live=False):
             logger.debug("Stored EWC info in database")
         except sqlite3.Error as e:
             logger.error(f"Database error while storing EWC info: {str(e)}")
-        finally:
-            conn.close()
         
         return data
     
@@ -335,33 +773,30 @@ def get_ewc_information(live=False):
         logger.error(f"Error processing EWC info: {str(e)}")
         return {}
 
+@coalesce_live
 def get_teams_ewc(live=False):
     """Fetch Esports World Cup 2025 teams from Liquipedia or database"""
     if not live:
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
-            cursor.execute('SELECT team_name, logo_url FROM teams')
+            cursor.execute('SELECT team_name, logo_url FROM teams ORDER BY position')
             teams_data = [{'team_name': row[0], 'logo_url': row[1]} for row in cursor.fetchall()]
-            conn.close()
             
             if teams_data:
                 logger.debug("Retrieved teams data from database")
                 return teams_data
         except sqlite3.Error as e:
             logger.error(f"Database error while fetching teams: {str(e)}")
+        if PRECOMPUTED:
+            # Not scraped by the scheduler yet; requests never scrape themselves
+            return []
         
     # Fetch from Liquipedia if live=True or no data in database
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
-    url = 'https://liquipedia.net/esports/Esports_World_Cup/2025'
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
 
         teams_data = []
         all_tables = soup.select('div.table-responsive table.wikitable.sortable')
@@ -393,20 +828,10 @@ def get_teams_ewc(live=False):
 
         # Store in database
         try:
-            conn = sqlite3.connect('news.db')
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM teams')  # Clear existing teams
-            for team in teams_data:
-                cursor.execute('''
-                    INSERT INTO teams (team_name, logo_url)
-                    VALUES (?, ?)
-                ''', (team['team_name'], team['logo_url']))
-            conn.commit()
-            logger.debug("Stored teams data in database")
+            upserted, deleted = sync_table('teams', ['team_name', 'logo_url'], teams_data)
+            logger.debug(f"Stored teams data in database ({upserted} upserted, {deleted} deleted)")
         except sqlite3.Error as e:
             logger.error(f"Database error while storing teams: {str(e)}")
-        finally:
-            conn.close()
 
         return teams_data
     
@@ -417,33 +842,30 @@ def get_teams_ewc(live=False):
         logger.error(f"Error processing teams data: {str(e)}")
         return []
 
+@coalesce_live
 def get_events_ewc(live=False):
     """Fetch Esports World Cup 2025 events from Liquipedia or database"""
     if not live:
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
-            cursor.execute('SELECT name, link FROM events')
+            cursor.execute('SELECT name, link FROM events ORDER BY position')
             events_data = [{'name': row[0], 'link': row[1]} for row in cursor.fetchall()]
-            conn.close()
             
             if events_data:
                 logger.debug("Retrieved events data from database")
                 return events_data
         except sqlite3.Error as e:
             logger.error(f"Database error while fetching events: {str(e)}")
+        if PRECOMPUTED:
+            # Not scraped by the scheduler yet; requests never scrape themselves
+            return []
         
     # Fetch from Liquipedia if live=True or no data in database
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
-    url = 'https://liquipedia.net/esports/Esports_World_Cup/2025'
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
 
         events_data = []
         events_headers = soup.select_one('div.esports-team-game-list')
@@ -464,20 +886,10 @@ def get_events_ewc(live=False):
         
         # Store in database
         try:
-            conn = sqlite3.connect('news.db')
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM events')  # Clear existing events
-            for event in events_data:
-                cursor.execute('''
-                    INSERT INTO events (name, link)
-                    VALUES (?, ?)
-                ''', (event['name'], event['link']))
-            conn.commit()
-            logger.debug("Stored events data in database")
+            upserted, deleted = sync_table('events', ['name', 'link'], events_data)
+            logger.debug(f"Stored events data in database ({upserted} upserted, {deleted} deleted)")
         except sqlite3.Error as e:
             logger.error(f"Database error while storing events: {str(e)}")
-        finally:
-            conn.close()
 
         return events_data
     
@@ -487,13 +899,14 @@ def get_events_ewc(live=False):
     except Exception as e:
         logger.error(f"Error processing events data: {str(e)}")
         return []
+@coalesce_live
 def get_prize_distribution(live=False):
     """Fetch Esports World Cup 2025 prize distribution from Liquipedia or database"""
     if not live:
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
-            cursor.execute('SELECT place, place_logo, prize, participants, logo_team FROM prize_distribution')
+            cursor.execute('SELECT place, place_logo, prize, participants, logo_team FROM prize_distribution ORDER BY position')
             prize_data = [
                 {
                     'place': row[0],
@@ -503,25 +916,21 @@ def get_prize_distribution(live=False):
                     'logo_team': row[4]
                 } for row in cursor.fetchall()
             ]
-            conn.close()
             
             if prize_data:
                 logger.debug("Retrieved prize distribution data from database")
                 return prize_data
         except sqlite3.Error as e:
             logger.error(f"Database error while fetching prize distribution: {str(e)}")
+        if PRECOMPUTED:
+            # Not scraped by the scheduler yet; requests never scrape themselves
+            return []
     
     # Fetch from Liquipedia if live=True or no data in database
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
-    URL = "https://liquipedia.net/esports/Esports_World_Cup/2025"
     
     try:
-        response = requests.get(URL, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
 
         prize_table = soup.select_one('div.prizepool-section-tables .csstable-widget')
         prize_data = []
@@ -558,26 +967,12 @@ def get_prize_distribution(live=False):
 
         # Store in database
         try:
-            conn = sqlite3.connect('news.db')
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM prize_distribution')  # Clear existing prize data
-            for prize in prize_data:
-                cursor.execute('''
-                    INSERT INTO prize_distribution (place, place_logo, prize, participants, logo_team)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    prize['place'],
-                    prize['place_logo'],
-                    prize['prize'],
-                    prize['participants'],
-                    prize['logo_team']
-                ))
-            conn.commit()
-            logger.debug("Stored prize distribution data in database")
+            upserted, deleted = sync_table(
+                'prize_distribution', ['place', 'place_logo', 'prize', 'participants', 'logo_team'], prize_data
+            )
+            logger.debug(f"Stored prize distribution data in database ({upserted} upserted, {deleted} deleted)")
         except sqlite3.Error as e:
             logger.error(f"Database error while storing prize distribution: {str(e)}")
-        finally:
-            conn.close()
 
         return prize_data
     
@@ -590,16 +985,13 @@ def get_prize_distribution(live=False):
 
 def get_group_stage_url(main_link, soup=None):
     """Helper function to get group stage URL from main link"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
     
     if not soup:
         try:
-            response = requests.get(main_link, headers=headers)
+            response = http_client.get(main_link)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text, parse_only=LINKS)
         except requests.RequestException as e:
             logger.error(f"Error fetching main link {main_link}: {str(e)}")
             return main_link.rstrip('/') + '/Group_Stage'
@@ -612,90 +1004,384 @@ def get_group_stage_url(main_link, soup=None):
 
     return main_link.rstrip('/') + '/Group_Stage'
 
+def fetch_group_stage(url):
+    """Download and parse a Group_Stage page; raises requests.RequestException on failure"""
+    logger.debug(f"Fetching data from {url}")
+    response = http_client.get(url)
+    response.raise_for_status()
+    return parse_group_stage(make_soup(response.text, parse_only=GROUP_STAGE_AREAS))
+
 def scrape_group_stage(game_name, link):
-    """Scrape group stage matches for a given game"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
-    BASE_URL = "https://liquipedia.net"
-    
+    """Scrape group stage matches for a given game
+
+    A game without a group stage page (404) gets a message; any other fetch or parse error is raised,
+    so the matches stored by the last good scrape are kept.
+    """
     url = get_group_stage_url(link)
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        group_boxes = soup.select('div.template-box')
+        data = fetch_group_stage(url)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 404:
+            raise
+        logger.warning(f"No group stage page for {game_name}: {str(e)}")
+        return {"message": f"{NOT_FOUND_PREFIX}{str(e)}"}
+    if not data:
+        return {"message": "Matches have not been added yet."}
+    return data
+
+def scrape_all_group_stages(games):
+    """Scrape the group stage of every game concurrently, returning ({game_name: data}, [failed game names])"""
+    def scrape(game):
+        try:
+            logger.debug(f"Fetching matches for {game['name']}")
+            return scrape_group_stage(game['name'], game['link'])
+        except Exception as e:
+            logger.error(f"Error fetching matches for {game['name']}: {str(e)}")
+            return None
 
-        if not group_boxes:
-            return {"message": "Matches have not been added yet."}
+    results = fan_out(scrape, games)
 
-        data = {}
-        for group in group_boxes:
-            group_name_tag = group.select_one('.brkts-matchlist-title')
-            group_name = group_name_tag.text.strip() if group_name_tag else 'Unknown Group'
-            matches = []
-
-            for match in group.select('.brkts-matchlist-match'):
-                teams = match.select('.brkts-matchlist-opponent')
-                if len(teams) == 2:
-                    team1 = teams[0].get('aria-label', 'N/A')
-                    logo1 = BASE_URL + teams[0].select_one('img')['src'] if teams[0].select_one('img') else 'N/A'
-                    team2 = teams[1].get('aria-label', 'N/A')
-                    logo2 = BASE_URL + teams[1].select_one('img')['src'] if teams[1].select_one('img') else 'N/A'
-                else:
-                    team1 = team2 = logo1 = logo2 = 'N/A'
+    all_matches = {}
+    failed_games = []
+    for game, match_data in zip(games, results):
+        if match_data is None:
+            failed_games.append(game['name'])
+        else:
+            all_matches[game['name']] = match_data
+    return all_matches, failed_games
+
+MATCH_COLUMNS = 'game, group_name, team1_name, team1_logo, team2_name, team2_logo, match_time_text, score, match_date, match_time, id'
+
+def row_to_match(row):
+    """Public JSON shape of a row selected with MATCH_COLUMNS"""
+    return {
+        "Team1": {"Name": row[2], "Logo": row[3]},
+        "Team2": {"Name": row[4], "Logo": row[5]},
+        "MatchTime": row[6],
+        "Score": row[7]
+    }
 
-                match_time = match.select_one('span.timer-object')
-                time_text = match_time.text.strip() if match_time else 'N/A'
+def select_matches(where='1=1', params=(), order_by='match_time, id', limit=-1, offset=0):
+    """Rows of MATCH_COLUMNS from the match store"""
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute(
+        f'SELECT {MATCH_COLUMNS} FROM matches WHERE {where} ORDER BY {order_by} LIMIT ? OFFSET ?',
+        list(params) + [limit, offset]
+    )
+    return cursor.fetchall()
+
+def store_group_stage(game_name, game_slug, match_data):
+    """Replace the stored group stage of one game in a single transaction"""
+    message = match_data.get('message') if isinstance(match_data, dict) and "message" in match_data else None
+
+    rows = []
+    if message is None:
+        for group_name, matches in match_data.items():
+            for position, match in enumerate(matches):
+                timestamp, match_date = parse_match_time(match.match_time)
+                rows.append((
+                    game_slug, game_name, group_name, position,
+                    match.team1, match.logo1, match.team2, match.logo2,
+                    match.score, match.match_time,
+                    timestamp, match_date
+                ))
 
-                score_tag = match.select_one('.brkts-matchlist-score')
-                score = score_tag.text.strip() if score_tag else 'N/A'
+    conn = get_db()
+    with conn:
+        conn.execute('''
+            INSERT INTO match_games (game_slug, game, message, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(game_slug) DO UPDATE SET
+                game = excluded.game, message = excluded.message, updated_at = excluded.updated_at
+        ''', (game_slug, game_name, message))
+        conn.executemany('''
+            INSERT INTO matches (
+                game_slug, game, group_name, position, team1_name, team1_logo,
+                team2_name, team2_logo, score, match_time_text, match_time, match_date
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(game_slug, group_name, position) DO UPDATE SET
+                game = excluded.game, team1_name = excluded.team1_name, team1_logo = excluded.team1_logo,
+                team2_name = excluded.team2_name, team2_logo = excluded.team2_logo, score = excluded.score,
+                match_time_text = excluded.match_time_text, match_time = excluded.match_time,
+                match_date = excluded.match_date, updated_at = CURRENT_TIMESTAMP
+        ''', rows)
+
+        # Drop matches that are no longer on the page
+        groups = list(match_data) if message is None else []
+        placeholders = ', '.join('?' for _ in groups)
+        conn.execute(
+            f'DELETE FROM matches WHERE game_slug = ? AND group_name NOT IN ({placeholders})',
+            [game_slug] + groups
+        )
+        conn.executemany(
+            'DELETE FROM matches WHERE game_slug = ? AND group_name = ? AND position >= ?',
+            [(game_slug, group_name, len(match_data[group_name])) for group_name in groups]
+        )
+    logger.debug(f"Stored {len(rows)} matches for {game_name}")
 
-                matches.append({
-                    "Team1": {"Name": team1, "Logo": logo1},
-                    "Team2": {"Name": team2, "Logo": logo2},
-                    "MatchTime": time_text,
-                    "Score": score
-                })
+def has_stored_matches():
+    """Whether the match store has been filled at least once"""
+    conn = get_db()
+    return conn.execute('SELECT 1 FROM match_games LIMIT 1').fetchone() is not None
+
+def import_all_matches_json():
+    """Fill the match store from a legacy all_matches_EWC.json file, if there is one"""
+    try:
+        with open('all_matches_EWC.json', 'r', encoding='utf-8') as f:
+            all_matches = json.load(f)
+    except FileNotFoundError:
+        return False
 
-            data[group_name] = matches
+    try:
+        slugs = {game['name']: game_slug_of(game['link']) for game in load_json('events_ewc.json')}
+    except (FileNotFoundError, json.JSONDecodeError):
+        slugs = {}
+
+    for game_name, match_data in all_matches.items():
+        game_slug = slugs.get(game_name) or re.sub(r'[^a-z0-9]', '', game_name.lower())
+        if "message" not in match_data:
+            match_data = {
+                group_name: [MatchRecord.from_json(match) for match in matches]
+                for group_name, matches in match_data.items()
+            }
+        store_group_stage(game_name, game_slug, match_data)
+    logger.debug("Imported all_matches_EWC.json into the matches table")
+    return True
+
+def refresh_all_matches(games):
+    """Scrape the group stage of games into the match store, returning the names of games that failed"""
+    def scrape():
+        all_matches, failed_games = scrape_all_group_stages(games)
+        now = datetime.now().timestamp()
+        for game in games:
+            if game['name'] in all_matches:
+                game_slug = game_slug_of(game['link'])
+                match_data = all_matches[game['name']]
+                store_group_stage(game['name'], game_slug, match_data)
+                # Remember a 404 the way scrape_ewc_group_stage does, so the per-game routes keep failing on it
+                error = match_data['message'].removeprefix(NOT_FOUND_PREFIX) if is_not_found_result(match_data) else None
+                group_stage_scraped.set(game_slug, (now, error))
+        return failed_games
+
+    key = ('group_stages',) + tuple(sorted(game_slug_of(game['link']) for game in games))
+    return scrape_flight.do(key, scrape)
+
+def game_name_for_slug(game_slug):
+    """Display name of a game slug, taken from the match store or events_ewc.json"""
+    conn = get_db()
+    row = conn.execute('SELECT game FROM match_games WHERE game_slug = ?', (game_slug,)).fetchone()
+    if row:
+        return row[0]
 
-        return data
-    except requests.RequestException as e:
-        logger.error(f"Error fetching group stage data for {game_name}: {str(e)}")
-        return {"message": f"Failed to fetch data: {str(e)}"}
-    except Exception as e:
-        logger.error(f"Error processing group stage data for {game_name}: {str(e)}")
-        return {"message": f"Server error: {str(e)}"}
+    try:
+        for game in load_json('events_ewc.json'):
+            if game_slug_of(game['link']) == game_slug:
+                return game['name']
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return game_slug
+
+# Game slug -> (scraped at, the 404 error message of a game without a group stage page or None).
+# Only the message is kept: the HTTPError would hold on to the whole error page.
+group_stage_scraped = LRUCache(GROUP_STAGE_CACHE_SIZE)
+
+def not_found_error(message):
+    """HTTPError for a remembered 404 of a group stage page"""
+    response = requests.Response()
+    response.status_code = 404
+    return requests.HTTPError(message, response=response)
+
+def scrape_ewc_group_stage(game_slug):
+    """Scrape one game's EWC group stage by slug into the match store; raises requests.RequestException on failure
+
+    Skipped when the game was scraped less than GROUP_STAGE_CACHE_TTL ago; a 404 is remembered as long,
+    so unknown slugs do not reach Liquipedia on every call.
+    """
+    scraped = group_stage_scraped.get(game_slug)
+    if scraped and datetime.now().timestamp() - scraped[0] < GROUP_STAGE_CACHE_TTL:
+        if scraped[1] is not None:
+            raise not_found_error(scraped[1])
+        return
+
+    def scrape():
+        try:
+            data = fetch_group_stage(f'https://liquipedia.net/{game_slug}/Esports_World_Cup/2025/Group_Stage')
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                group_stage_scraped.set(game_slug, (datetime.now().timestamp(), str(e)))
+            raise
+        store_group_stage(game_name_for_slug(game_slug), game_slug, data or {"message": "Matches have not been added yet."})
+        group_stage_scraped.set(game_slug, (datetime.now().timestamp(), None))
+
+    # Every per-game route reads the same page; concurrent requests for one game share a scrape
+    return scrape_flight.do(('group_stage', game_slug), scrape)
+
+def match_poll_interval(start_times, now=None):
+    """Seconds until a page with matches starting at start_times (UTC timestamps) should be polled again"""
+    now = datetime.now().timestamp() if now is None else now
+    return adaptive_interval(
+        start_times, now, REFRESH_LIVE_INTERVAL, REFRESH_IDLE_INTERVAL, MATCH_LEAD_TIME, MATCH_LIVE_WINDOW
+    )
 
+def group_stage_start_times(game_slug):
+    """Start times of a game's stored group stage matches whose time is known"""
+    conn = get_db()
+    rows = conn.execute(
+        'SELECT match_time FROM matches WHERE game_slug = ? AND match_time < ?', (game_slug, UNKNOWN_MATCH_TIME)
+    )
+    return [row[0] for row in rows]
+
+def matches_cache_ttl(data):
+    """Freshness of a cached Liquipedia:Matches page, following its upcoming match times"""
+    times = [
+        match.get('time', '')
+        for matches in (data.get('upcoming') or {}).values()
+        for match in matches
+    ] if isinstance(data, dict) else []
+    start_times = [match_timestamp(text) for text in times]
+    if any(start == UNKNOWN_MATCH_TIME for start in start_times):
+        # Cannot tell when these are played; keep the fixed interval
+        return REFRESH_LIQUIPEDIA_INTERVAL
+    return match_poll_interval(start_times)
+
+# Game slug -> when its group stage is next due, following its own match times
+_group_stage_due = {}
+# Game slug -> group stage scrapes failed in a row, for the retry backoff
+_group_stage_failures = {}
+
+def refresh_ewc_page(force=False):
+    """Scheduled job: re-read info, teams, events, games and prizes from one EWC page snapshot
+
+    The extractors log and swallow their errors, so the job fetches the snapshot itself (raising
+    when Liquipedia cannot be reached) and raises when an extractor found nothing on the page.
+    """
+    get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
+    extractors = (get_ewc_information, get_teams_ewc, get_events_ewc, get_ewc_games, get_prize_distribution)
+    empty = [extractor.__name__ for extractor in extractors if not extractor(live=True)]
+    if empty:
+        raise RuntimeError(f"Nothing extracted from the EWC page by {', '.join(empty)}")
+
+def refresh_group_stages(force=False):
+    """Scheduled job: re-scrape the group stages that are due (all of them when forced)"""
+    games = load_events_json()
+    if not games:
+        raise RuntimeError("No events data available")
+
+    now = datetime.now().timestamp()
+    due = [game for game in games if force or _group_stage_due.get(game_slug_of(game['link']), 0) <= now]
+    if not due:
+        return
+    failed_games = refresh_all_matches(due)
+    if failed_games:
+        logger.warning(f"Group stage refresh failed for {', '.join(failed_games)}")
+
+    now = datetime.now().timestamp()
+    for game in due:
+        game_slug = game_slug_of(game['link'])
+        if game['name'] in failed_games:
+            # Its stored matches were kept; retry soon, backing off while Liquipedia stays down
+            failures = _group_stage_failures.get(game_slug, 0) + 1
+            _group_stage_failures[game_slug] = failures
+            interval = min(REFRESH_LIVE_INTERVAL * 2 ** (failures - 1), REFRESH_LIQUIPEDIA_INTERVAL)
+        else:
+            _group_stage_failures.pop(game_slug, None)
+            interval = match_poll_interval(group_stage_start_times(game_slug), now)
+        _group_stage_due[game_slug] = now + interval
+
+def group_stage_interval():
+    """Seconds until the next game's group stage is due"""
+    if not _group_stage_due:
+        # Nothing scheduled yet (the events list could not be loaded); retry soon
+        return REFRESH_LIQUIPEDIA_INTERVAL
+    return max(1, min(_group_stage_due.values()) - datetime.now().timestamp())
+
+def liquipedia_slugs(kind):
+    return sorted(set(cached_game_slugs(kind)) | set(REFRESH_GAME_SLUGS))
+
+def refresh_liquipedia_caches(force=False):
+    """Scheduled job: revalidate the tournaments and matches caches that went stale"""
+    jobs = [
+        (fetch_tournaments, slug, REFRESH_LIQUIPEDIA_INTERVAL) for slug in liquipedia_slugs('tournaments')
+    ] + [
+        (get_matches_by_status, slug, matches_cache_ttl) for slug in liquipedia_slugs('matches')
+    ]
+    fan_out(lambda job: job[0](job[1], force=force, ttl=job[2], wait_if_stale=True), jobs)
+
+def liquipedia_interval():
+    """Seconds until the first tournaments or matches cache goes stale"""
+    remaining = [
+        seconds_until_stale(slug, 'tournaments', REFRESH_LIQUIPEDIA_INTERVAL) for slug in liquipedia_slugs('tournaments')
+    ] + [
+        seconds_until_stale(slug, 'matches', matches_cache_ttl) for slug in liquipedia_slugs('matches')
+    ]
+    # Caches that failed to refresh stay missing; do not hammer Liquipedia for them
+    return max(REFRESH_LIVE_INTERVAL, min(remaining, default=REFRESH_LIQUIPEDIA_INTERVAL))
+
+def build_scheduler():
+    """Refresh scheduler with one job per dataset"""
+    scheduler = RefreshScheduler()
+    scheduler.add('ewc_page', refresh_ewc_page, REFRESH_EWC_PAGE_INTERVAL)
+    scheduler.add('group_stages', refresh_group_stages, group_stage_interval)
+    scheduler.add('liquipedia', refresh_liquipedia_caches, liquipedia_interval)
+    if REFRESH_MODE == 'worker':
+        scheduler.add('refresh_requests', run_refresh_requests, REFRESH_REQUEST_POLL_INTERVAL)
+    return scheduler
+
+def request_refresh(job):
+    """Make a refresh job due now: directly with an in-process scheduler, through refresh_requests for worker.py"""
+    if REFRESH_MODE != 'worker':
+        return scheduler.trigger(job)
+    conn = get_db()
+    with conn:
+        conn.execute('INSERT OR IGNORE INTO refresh_requests (job) VALUES (?)', (job,))
+    return True
+
+def run_refresh_requests(force=False):
+    """Scheduled job of worker.py: trigger the jobs web processes asked for since the last poll"""
+    conn = get_db()
+    with conn:
+        jobs = [row[0] for row in conn.execute('DELETE FROM refresh_requests RETURNING job')]
+    for job in jobs:
+        if not scheduler.trigger(job):
+            logger.warning(f"Ignoring refresh request for unknown job {job}")
+
+scheduler = build_scheduler()
+
+def requested_live(job):
+    """The request's live flag; with a scheduler it only moves the job up and data is read as stored"""
+    live = request.args.get('live', 'false').lower() == 'true'
+    if PRECOMPUTED:
+        if live:
+            request_refresh(job)
+        return False
+    return live
 
+@coalesce_live
 def get_ewc_games(live=False):
     """Fetch Esports World Cup 2025 games from Liquipedia or database"""
     if not live:
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
-            cursor.execute('SELECT game_name, logo_url FROM games')
+            cursor.execute('SELECT game_name, logo_url FROM games ORDER BY position')
             games_data = [{'game_name': row[0], 'logo_url': row[1]} for row in cursor.fetchall()]
-            conn.close()
             
             if games_data:
                 logger.debug("Retrieved games data from database")
                 return games_data
         except sqlite3.Error as e:
             logger.error(f"Database error while fetching games: {str(e)}")
+        if PRECOMPUTED:
+            # Not scraped by the scheduler yet; requests never scrape themselves
+            return []
         
     # Fetch from Liquipedia if live=True or no data in database
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
     BASE_URL = "https://liquipedia.net"
-    url = 'https://liquipedia.net/esports/Esports_World_Cup/2025'
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_page_soup(EWC_URL, parse_only=EWC_PAGE_AREAS)
 
         games_data = []
         target_table = None
@@ -725,20 +1411,10 @@ def get_ewc_games(live=False):
 
         # Store in database
         try:
-            conn = sqlite3.connect('news.db')
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM games')  # Clear existing games
-            for game in games_data:
-                cursor.execute('''
-                    INSERT INTO games (game_name, logo_url)
-                    VALUES (?, ?)
-                ''', (game['game_name'], game['logo_url']))
-            conn.commit()
-            logger.debug("Stored games data in database")
+            upserted, deleted = sync_table('games', ['game_name', 'logo_url'], games_data)
+            logger.debug(f"Stored games data in database ({upserted} upserted, {deleted} deleted)")
         except sqlite3.Error as e:
             logger.error(f"Database error while storing games: {str(e)}")
-        finally:
-            conn.close()
 
         return games_data
     
@@ -826,7 +1502,7 @@ def setup_routes(app):
         description = description[:2000]
         
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             
             logger.debug(f"Inserting news item with thumbnail_url: {final_thumbnail_url}")
@@ -850,8 +1526,6 @@ def setup_routes(app):
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/news', methods=['GET'])
     def get_news():
@@ -873,44 +1547,61 @@ def setup_routes(app):
           - name: search
             in: query
             type: string
+            description: Words matched as prefixes against title and description
           - name: sort
             in: query
             type: string
-            enum: [created_at, title]
-            default: created_at
+            enum: [created_at, title, relevance]
+            description: Defaults to relevance when search is given without a cursor, otherwise created_at
+          - name: cursor
+            in: query
+            type: string
+            description: Keyset pagination; pass an empty value for the first page, then the returned next_cursor. Replaces page
+          - name: include_total
+            in: query
+            type: boolean
+            default: true
+            description: Set to false to skip counting; pagination then reports has_next instead of total and pages
         responses:
           200:
             description: List of news items
+          400:
+            description: Invalid cursor, or cursor combined with sort=relevance
         """
         page = max(1, request.args.get('page', 1, type=int))
         per_page = max(1, min(100, request.args.get('per_page', 10, type=int)))
         writer = request.args.get('writer', '').strip()
         search = request.args.get('search', '').strip()
-        sort = request.args.get('sort', 'created_at').strip()
+        cursor_token = request.args.get('cursor')
+        keyset = cursor_token is not None
+        include_total = request.args.get('include_total', 'true').lower() != 'false'
+        default_sort = 'relevance' if search and not keyset else 'created_at'
+        sort = request.args.get('sort', default_sort).strip()
         
-        if sort not in ('created_at', 'title'):
+        if sort not in ('created_at', 'title', 'relevance'):
             sort = 'created_at'
+        if keyset and sort == 'relevance':
+            return jsonify({"error": "cursor pagination supports sort=created_at or sort=title"}), 400
+
+        after = None
+        if cursor_token:
+            try:
+                after = decode_cursor(cursor_token, sort, (str, int))
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
             
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             
-            query = 'SELECT id, title, description, writer, thumbnail_url, news_link, created_at, updated_at FROM news WHERE 1=1'
-            params = []
-            
-            if writer:
-                query += ' AND writer LIKE ?'
-                params.append(f'%{writer}%')
-                
-            if search:
-                query += ' AND (title LIKE ? OR description LIKE ?)'
-                params.extend([f'%{search}%', f'%{search}%'])
-                
-            query += f' ORDER BY {sort} DESC'
-            query += ' LIMIT ? OFFSET ?'
-            params.extend([per_page, (page - 1) * per_page])
+            filters = news_filters(writer, search)
+            source, where, params = filters
+            query, page_params = news_page_query(filters, sort, after)
+            offset = 0 if keyset else (page - 1) * per_page
             
-            cursor.execute(query, params)
+            # One extra row tells whether another page follows
+            cursor.execute(query, page_params + [per_page + 1, offset])
+            rows = cursor.fetchall()
             news_items = [
                 {
                     'id': row[0],
@@ -921,40 +1612,44 @@ def setup_routes(app):
                     'news_link': row[5],
                     'created_at': row[6],
                     'updated_at': row[7]
-                } for row in cursor.fetchall()
+                } for row in rows[:per_page]
             ]
             
             logger.debug(f"Retrieved news items: {[item['thumbnail_url'] for item in news_items]}")
             
-            count_query = 'SELECT COUNT(*) FROM news WHERE 1=1'
-            count_params = []
-            
-            if writer:
-                count_query += ' AND writer LIKE ?'
-                count_params.append(f'%{writer}%')
-                
-            if search:
-                count_query += ' AND (title LIKE ? OR description LIKE ?)'
-                count_params.extend([f'%{search}%', f'%{search}%'])
-                
-            cursor.execute(count_query, count_params)
-            total = cursor.fetchone()[0]
+            # Totals come from the counters when possible; only search needs a COUNT query
+            total = stored_news_total(writer, search) if include_total else None
+            if include_total and total is None:
+                cursor.execute(f'SELECT COUNT(*) FROM {source} WHERE {where}', params)
+                total = cursor.fetchone()[0]
+            has_next = len(rows) > per_page
+
+            if keyset:
+                last = news_items[-1] if has_next else None
+                pagination = {
+                    'per_page': per_page,
+                    'next_cursor': encode_cursor(sort, last[sort], last['id']) if last else None
+                }
+            else:
+                pagination = {
+                    'page': page,
+                    'per_page': per_page
+                }
+            if include_total:
+                pagination['total'] = total
+                if not keyset:
+                    pagination['pages'] = (total + per_page - 1) // per_page
+            else:
+                pagination['has_next'] = has_next
             
             return jsonify({
                 'news': news_items,
-                'pagination': {
-                    'page': page,
-                    'per_page': per_page,
-                    'total': total,
-                    'pages': (total + per_page - 1) // per_page
-                }
+                'pagination': pagination
             })
             
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/news/<int:id>', methods=['PUT'])
     def update_news(id):
@@ -994,14 +1689,12 @@ def setup_routes(app):
             description: News item not found
         """
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('SELECT id FROM news WHERE id = ?', (id,))
             if not cursor.fetchone():
-                conn.close()
                 return jsonify({"error": "News item not found"}), 404
         except sqlite3.Error as e:
-            conn.close()
             return jsonify({"error": f"Database error: {str(e)}"}), 500
             
         title = request.form.get('title', '').strip()
@@ -1048,7 +1741,6 @@ def setup_routes(app):
             update_data['news_link'] = news_link
             
         if not update_data:
-            conn.close()
             return jsonify({"error": "No data provided to update"}), 400
             
         update_data['updated_at'] = datetime.utcnow().isoformat()
@@ -1066,8 +1758,6 @@ def setup_routes(app):
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/news/<int:id>', methods=['DELETE'])
     def delete_news(id):
@@ -1086,7 +1776,7 @@ def setup_routes(app):
             description: News item not found
         """
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute('SELECT id FROM news WHERE id = ?', (id,))
@@ -1101,8 +1791,6 @@ def setup_routes(app):
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/news', methods=['DELETE'])
     def delete_all_news():
@@ -1116,7 +1804,7 @@ def setup_routes(app):
             description: Database error
         """
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute('DELETE FROM news')
@@ -1129,8 +1817,6 @@ def setup_routes(app):
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/reset_db', methods=['POST'])
     def reset_db():
@@ -1155,7 +1841,7 @@ def setup_routes(app):
         clear_uploads = data.get('clear_uploads', False)
         
         try:
-            conn = sqlite3.connect('news.db')
+            conn = get_db()
             cursor = conn.cursor()
             
             cursor.execute('DELETE FROM news')
@@ -1185,8 +1871,6 @@ def setup_routes(app):
         except sqlite3.Error as e:
             logger.error(f"Database error: {str(e)}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     @app.route('/api/ewc_matches', methods=['POST'])
     def get_ewc_matches():
@@ -1219,60 +1903,12 @@ def setup_routes(app):
         game_slug = re.sub(r'[^a-z0-9]', '', game_slug.lower())
 
         try:
-            url = f'https://liquipedia.net/{game_slug}/Esports_World_Cup/2025/Group_Stage'
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'
-            }
-            logger.debug(f"Fetching data from {url}")
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            data = {}
-            group_boxes = soup.select('div.template-box')
-            for group in group_boxes:
-                group_name_tag = group.select_one('.brkts-matchlist-title')
-                group_name = group_name_tag.text.strip() if group_name_tag else 'Unknown Group'
-
-                group_matches = []
-                matches_by_day = group.select('.brkts-matchlist-match')
-
-                for match in matches_by_day:
-                    teams = match.select('.brkts-matchlist-opponent')
-
-                    if len(teams) == 2:
-                        team1_name = teams[0].get('aria-label', 'N/A')
-                        logo1_tag = teams[0].select_one('img')
-                        logo1 = f"https://liquipedia.net{logo1_tag['src']}" if logo1_tag else "N/A"
-
-                        team2_name = teams[1].get('aria-label', 'N/A')
-                        logo2_tag = teams[1].select_one('img')
-                        logo2 = f"https://liquipedia.net{logo2_tag['src']}" if logo2_tag else "N/A"
-                    else:
-                        team1_name, logo1 = "N/A", "N/A"
-                        team2_name, logo2 = "N/A", "N/A"
-
-                    time_tag = match.select_one('span.timer-object')
-                    match_time = time_tag.text.strip() if time_tag else "N/A"
-
-                    score_tag = match.select_one('.brkts-matchlist-score')
-                    score = score_tag.text.strip() if score_tag else "N/A"
-
-                    match_info = {
-                        "Team1": {
-                            "Name": team1_name,
-                            "Logo": logo1
-                        },
-                        "Team2": {
-                            "Name": team2_name,
-                            "Logo": logo2
-                        },
-                        "MatchTime": match_time,
-                        "Score": score
-                    }
-
-                    group_matches.append(match_info)
+            if not PRECOMPUTED:
+                scrape_ewc_group_stage(game_slug)
 
-                data[group_name] = group_matches
+            data = {}
+            for row in select_matches('game_slug = ?', [game_slug], order_by='group_name, position'):
+                data.setdefault(row[1], []).append(row_to_match(row))
 
             logger.debug(f"Successfully retrieved EWC match data for {game_slug}")
             return jsonify({
@@ -1319,107 +1955,33 @@ def setup_routes(app):
 
         if not game_slug:
             logger.error("Missing 'game' in request body")
-            return jsonify({"error": "Missing 'game' error"})
-        return jsonify({"error": "Missing 'game' in request body"}), 400
+            return jsonify({"error": "Missing 'game' in request body"}), 400
 
         if filter_date and not is_valid_date(filter_date):
             logger.error(f"Invalid date format: {filter_date}. Expected YYYY-MM-DD")
             return jsonify({"error": "Invalid date format. Expected YYYY-MM-DD"}), 400
 
-        game_slug = re.sub(r'[^a-z0-0-9]', '', game_slug.lower())
+        game_slug = re.sub(r'[^a-z0-9]', '', game_slug.lower())
 
         try:
-            url = f'https://liquipedia.net/{game_slug}/Esports_World_Cup/2025/Group_Stage'
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'
-            }
-            logger.debug(f"Fetching data from {url}")
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            matches_by_day = defaultdict(lambda: defaultdict(list))
-            group_boxes = soup.select('div.template-box')
-            for group in group_boxes:
-                group_name_tag_name_tag = group.select_one('.brkts-matchlist-title')
-                group_name = group_name_tag.text.strip() if group_name_tag else 'Unknown Group'
-
-                matches_by_day_group = group.select('.brkts-matchlist-match')
-
-                for match in matches_by_day_group:
-                    teams = match.select('.brkts-matchlist-opponent')
+            if not PRECOMPUTED:
+                scrape_ewc_group_stage(game_slug)
 
-                    if len(teams) == 2:
-                        team1_name = teams[0].get('aria-label', 'N/A')
-                        logo1_tag = teams[0].select_one('img')
-                        logo1 = f"https://liquipedia.net{logo1_tag['src']}" if logo1_tag else "N/A"
+            where, params = 'game_slug = ?', [game_slug]
+            if filter_date:
+                where += ' AND match_date = ?'
+                params.append(filter_date)
 
-                        team2_name = teams[1].get('aria-label', 'N/A')
-                        logo2_tag = teams[1].select_one('img')
-                        logo2 = f"https://liquipedia.net{logo2_tag['src']}" if logo2_tag else "N/A"
-                    else:
-                        team1_name, logo1 = "N/A", "N/A"
-                        team2_name, logo2 = "N/A", "N/A"
-
-                    time_tag = match.select_one('span.timer-object')
-                    match_time = time_tag.text.strip() if time_tag else "N/A"
-
-                    score_tag = match.select_one('.brkts-matchlist-score')
-                    score = score_tag.text.strip() if score_tag else "N/A"
-
-                    try:
-                        date_str = ' '.join(match_time.split(' - ')[0].split()[:3])
-                        parsed_date = dt.strptime(date_str, '%B %d, %Y')
-                        match_date = parsed_date.strftime('%Y-%m-%d')
-                    except (IndexError, ValueError):
-                        match_date = "Unknown Date"
-
-                    if filter_date and match_date != filter_date:
-                        continue
-
-                    match_info = {
-                        "Team1": {
-                            "Name": team1_name,
-                            "Logo": logo1
-                        },
-                        "Team2": {
-                            "Name": team2_name,
-                            "Logo": logo2
-                        },
-                        "MatchTime": match_time,
-                        "Score": score,
-                        "_sort_time": parse_match_datetime(match_time)
-                    }
-
-                    matches_by_day[match_date][group_name].append(match_info)
+            matches_by_day = defaultdict(lambda: defaultdict(list))
+            for row in select_matches(where, params, order_by='match_time, position'):
+                matches_by_day[row[8]][row[1]].append(row_to_match(row))
 
             formatted_data = {}
-            date_groups = []
-            for date in matches_by_day.keys():
-                try:
-                    parsed_date = dt.strptime(date, '%Y-%m-%d') if date != "Unknown Date" else dt.max
-                    groups = {}
-                    for group in sorted(matches_by_day[date].keys()):
-                        sorted_matches = sorted(
-                            matches_by_day[date][group],
-                            key=lambda x: x['_sort_time']
-                        )
-                        groups[group] = [{k: v for k, v in match.items() if k != '_sort_time'} for match in sorted_matches]
-                    date_groups.append((parsed_date, date, groups))
-                except ValueError:
-                    date_groups.append((dt.max, date, {
-                        group: [
-                            {k: v for k, v in match.items() if k != '_sort_time'}
-                            for match in sorted(
-                                matches_by_day[date][group],
-                                key=lambda x: x['_sort_time']
-                            )
-                        ]
-                        for group in sorted(matches_by_day[date].keys())
-                    }))
-
-            date_groups.sort(key=lambda x: x[0])
-            for _, date_str, groups in date_groups:
-                formatted_data[date_str] = groups
+            for date in sorted(matches_by_day, key=lambda d: (d == UNKNOWN_MATCH_DATE, d)):
+                formatted_data[date] = {
+                    group: matches_by_day[date][group]
+                    for group in sorted(matches_by_day[date])
+                }
 
             logger.debug(f"Successfully retrieved EWC match data for {game_slug}{' on ' + filter_date if filter_date else ''}")
             return jsonify({
@@ -1479,79 +2041,15 @@ def setup_routes(app):
         game_slug = re.sub(r'[^a-z0-9]', '', game_slug.lower())
 
         try:
-            url = f'https://liquipedia.net/{game_slug}/Esports_World_Cup/2025/Group_Stage'
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36'
-            }
-            logger.debug(f"Fetching data from {url}")
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            matches_by_group = defaultdict(list)
-            group_boxes = soup.select('div.template-box')
-            for group in group_boxes:
-                group_name_tag = group.select_one('.brkts-matchlist-title')
-                group_name = group_name_tag.text.strip() if group_name_tag else 'Unknown Group'
-
-                matches_by_day_group = group.select('.brkts-matchlist-match')
-
-                for match in matches_by_day_group:
-                    teams = match.select('.brkts-matchlist-opponent')
-
-                    if len(teams) == 2:
-                        team1_name = teams[0].get('aria-label', 'N/A')
-                        logo1_tag = teams[0].select_one('img')
-                        logo1 = f"https://liquipedia.net{logo1_tag['src']}" if logo1_tag else 'N/A'
+            if not PRECOMPUTED:
+                scrape_ewc_group_stage(game_slug)
 
-                        team2_name = teams[1].get('aria-label', 'N/A')
-                        logo2_tag = teams[1].select_one('img')
-                        logo2 = f"https://liquipedia.net{logo2_tag['src']}" if logo2_tag else 'N/A'
-                    else:
-                        team1_name, logo1 = 'N/A', 'N/A'
-                        team2_name, logo2 = 'N/A', 'N/A'
-
-                    time_tag = match.select_one('span.timer-object')
-                    match_time = time_tag.text.strip() if time_tag else 'N/A'
-
-                    score_tag = match.select_one('.brkts-matchlist-score')
-                    score = score_tag.text.strip() if score_tag else 'N/A'
-
-                    try:
-                        date_str = ' '.join(match_time.split(' - ')[0].split()[:3])
-                        parsed_date = dt.strptime(date_str, '%B %d, %Y')
-                        match_date = parsed_date.strftime('%Y-%m-%d')
-                    except (IndexError, ValueError):
-                        match_date = 'Unknown Date'
-
-                    if match_date != filter_date:
-                        continue
-
-                    match_info = {
-                        'Team1': {
-                            'Name': team1_name,
-                            'Logo': logo1
-                        },
-                        'Team2': {
-                            'Name': team2_name,
-                            'Logo': logo2
-                        },
-                        'MatchTime': match_time,
-                        'Score': score,
-                        '_sort_time': parse_match_datetime(match_time)
-                    }
+            matches_by_group = defaultdict(list)
+            rows = select_matches('game_slug = ? AND match_date = ?', [game_slug, filter_date], order_by='match_time, position')
+            for row in rows:
+                matches_by_group[row[1]].append(row_to_match(row))
 
-                    matches_by_group[group_name].append(match_info)
-
-            formatted_data = {}
-            for group in sorted(matches_by_group.keys()):
-                sorted_matches = sorted(
-                    matches_by_group[group],
-                    key=lambda x: x['_sort_time']
-                )
-                formatted_data[group] = [
-                    {k: v for k, v in match.items() if k != '_sort_time'}
-                    for match in sorted_matches
-                ]
+            formatted_data = {group: matches_by_group[group] for group in sorted(matches_by_group)}
 
             logger.debug(f"Successfully retrieved EWC match data for {game_slug} on {filter_date}")
             return jsonify({
@@ -1583,7 +2081,7 @@ def setup_routes(app):
           500:
             description: Server error while fetching EWC information
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('ewc_page')
         
         try:
             info_data = get_ewc_information(live=live)
@@ -1621,7 +2119,7 @@ def setup_routes(app):
           500:
             description: Server error while fetching teams data
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('ewc_page')
         
         try:
             teams_data = get_teams_ewc(live=live)
@@ -1659,7 +2157,7 @@ def setup_routes(app):
           500:
             description: Server error while fetching events data
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('ewc_page')
         
         try:
             events_data = get_events_ewc(live=live)
@@ -1716,172 +2214,128 @@ def setup_routes(app):
             type: string
             required: false
             description: Filter by date (YYYY-MM-DD, e.g., '2025-07-08')
+          - name: cursor
+            in: query
+            type: string
+            required: false
+            description: Keyset pagination; pass an empty value for the first page, then the returned next_cursor. Replaces page
         responses:
           200:
             description: Successfully retrieved all match data
           400:
-            description: Invalid date format
+            description: Invalid date format or cursor
           500:
             description: Server error while fetching match data
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('group_stages')
         page = max(1, request.args.get('page', 1, type=int))
         per_page = max(1, min(100, request.args.get('per_page', 10, type=int)))
         filter_game = request.args.get('game', '').strip()
         filter_group = request.args.get('group', '').strip()
         filter_date = request.args.get('date', '').strip()
+        cursor_token = request.args.get('cursor')
+        keyset = cursor_token is not None
 
         if filter_date and not is_valid_date(filter_date):
             logger.error(f"Invalid date format: {filter_date}. Expected YYYY-MM-DD")
             return jsonify({"error": "Invalid date format. Expected YYYY-MM-DD"}), 400
 
-        try:
-            if not live:
-                # Try to load from cached JSON file
-                try:
-                    with open('all_matches_EWC.json', 'r', encoding='utf-8') as f:
-                        all_matches = json.load(f)
-                    logger.debug("Successfully retrieved all EWC match data from cached JSON")
-                except FileNotFoundError:
-                    logger.warning("Cached all_matches_EWC.json not found")
-                    all_matches = None
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error decoding all_matches_EWC.json: {str(e)}")
-                    return jsonify({"error": f"Error decoding cached data: {str(e)}"}), 500
-            else:
-                all_matches = None
-
-            # Fetch events data (from JSON or Liquipedia)
+        after = None
+        if cursor_token:
             try:
-                with open('events_ewc.json', 'r', encoding='utf-8') as f:
-                    games = json.load(f)
-                logger.debug("Retrieved events data from events_ewc.json")
-            except FileNotFoundError:
-                logger.warning("events_ewc.json not found, fetching events from Liquipedia")
-                games = get_events_ewc(live=True)
-                if not games:
-                    logger.error("No events data available from Liquipedia")
-                    return jsonify({"error": "No events data available"}), 500
-                # Save fetched events to JSON file for future caching
-                try:
-                    with open('events_ewc.json', 'w', encoding='utf-8') as f:
-                        json.dump(games, f, ensure_ascii=False, indent=2)
-                    logger.debug("Saved events data to events_ewc.json")
-                except Exception as e:
-                    logger.error(f"Error saving events_ewc.json: {str(e)}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Error decoding events_ewc.json: {str(e)}")
-                return jsonify({"error": f"Error decoding events data: {str(e)}"}), 500
-
-            if all_matches:
-                all_matches = {}
-                failed_games = []
-                for game in games:
-                    game_name = game['name']
-                    game_link = game['link']
-                    if filter_game and game_name.lower() != filter_game.lower():
-                        continue
+                after = decode_cursor(cursor_token, 'match_time', (int, int))
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+        try:
+            failed_games = []
+            if not PRECOMPUTED and (live or not has_stored_matches()):
+                if live or not import_all_matches_json():
+                    # Fetch events data (from JSON or Liquipedia)
                     try:
-                        logger.debug(f"Fetching matches for {game_name}")
-                        match_data = scrape_group_stage(game_name, game_link)
-                        if isinstance(match_data, dict) and "message" in match_data and "404 Client Error" in match_data["message"]:
-                            failed_games.append(game_name)
-                            continue
-                        all_matches[game_name] = match_data
-                    except Exception as e:
-                        logger.error(f"Error fetching matches for {game_name}: {str(e)}")
-                        failed_games.append(game_name)
-                        continue
+                        games = load_events_json()
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Error decoding events_ewc.json: {str(e)}")
+                        return jsonify({"error": f"Error decoding events data: {str(e)}"}), 500
+                    if not games:
+                        logger.error("No events data available from Liquipedia")
+                        return jsonify({"error": "No events data available"}), 500
 
-                # Save to JSON file for caching
-                try:
-                    with open('all_matches_EWC.json', 'w', encoding='utf-8') as f:
-                        json.dump(all_matches, f, ensure_ascii=False, indent=2)
-                    logger.debug("Saved all matches to all_matches_EWC.json")
-                except Exception as e:
-                    logger.error(f"Error saving all_matches_EWC.json: {str(e)}")
-            else:
-                failed_games = []
-                # Filter out 404 errors from cached data
-                games_to_remove = []
-                for game_name, match_data in all_matches.items():
-                    if isinstance(match_data, dict) and "message" in match_data and "404 Client Error" in match_data["message"]:
-                        failed_games.append(game_name)
-                        games_to_remove.append(game_name)
-                for game_name in games_to_remove:
-                    del all_matches[game_name]
-
-            # Collect all matches for sorting
-            all_matches_list = []
-            for game_name, game_data in all_matches.items():
-                if filter_game and game_name.lower() != filter_game.lower():
-                    continue
-                if isinstance(game_data, dict) and "message" in game_data:
-                    continue  # Skip games with error messages
-
-                for group_name, matches in game_data.items():
-                    if filter_group and group_name.lower() != filter_group.lower():
-                        continue
-                    for match in matches:
-                        match_time = match.get('MatchTime', 'N/A')
-                        try:
-                            date_str = ' '.join(match_time.split(' - ')[0].split()[:3]) if ' - ' in match_time else match_time
-                            parsed_date = dt.strptime(date_str, '%B %d, %Y')
-                            match_date = parsed_date.strftime('%Y-%m-%d')
-                        except (IndexError, ValueError):
-                            match_date = "Unknown Date"
-
-                        if filter_date and match_date != filter_date:
-                            continue
-
-                        all_matches_list.append({
-                            "game": game_name,
-                            "group": group_name,
-                            "match": match,
-                            "_sort_datetime": parse_match_datetime(match_time)
-                        })
-
-            # Sort matches by datetime
-            sorted_matches = sorted(
-                all_matches_list,
-                key=lambda x: x['_sort_datetime']
-            )
+                    games = [
+                        game for game in games
+                        if not filter_game or game['name'].lower() == filter_game.lower()
+                    ]
+                    failed_games = refresh_all_matches(games)
 
-            # Apply pagination
-            total_matches = len(sorted_matches)
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-            paginated_matches = sorted_matches[start_idx:end_idx]
+            where = ['1=1']
+            params = []
+            if filter_game:
+                where.append('game = ?')
+                params.append(filter_game)
+            if filter_group:
+                where.append('group_name = ?')
+                params.append(filter_group)
+            if filter_date:
+                where.append('match_date = ?')
+                params.append(filter_date)
+            where = ' AND '.join(where)
+
+            conn = get_db()
+            cursor = conn.cursor()
+            cursor.execute(f'SELECT COUNT(*) FROM matches WHERE {where}', params)
+            total_matches = cursor.fetchone()[0]
+
+            game_where, game_params = ('game = ?', [filter_game]) if filter_game else ('1=1', [])
+            cursor.execute(
+                f'SELECT game, message FROM match_games WHERE message IS NOT NULL AND {game_where} ORDER BY game',
+                game_params
+            )
+            messages = cursor.fetchall()
+
+            # Apply pagination in SQL; keyset pages seek past the last (match_time, id) seen
+            next_cursor = None
+            if keyset:
+                if after:
+                    where += ' AND (match_time, id) > (?, ?)'
+                    params.extend(after)
+                rows = select_matches(where, params, limit=per_page + 1)
+                if len(rows) > per_page:
+                    rows = rows[:per_page]
+                    next_cursor = encode_cursor('match_time', rows[-1][9], rows[-1][10])
+            else:
+                rows = select_matches(where, params, limit=per_page, offset=(page - 1) * per_page)
 
             # Reconstruct filtered and paginated matches into the original structure
             filtered_matches = {}
-            for match_item in paginated_matches:
-                game_name = match_item['game']
-                group_name = match_item['group']
-                match = match_item['match']
-                if game_name not in filtered_matches:
-                    filtered_matches[game_name] = {}
-                if group_name not in filtered_matches[game_name]:
-                    filtered_matches[game_name][group_name] = []
-                filtered_matches[game_name][group_name].append(match)
+            for row in rows:
+                filtered_matches.setdefault(row[0], {}).setdefault(row[1], []).append(row_to_match(row))
 
             # Include games with messages (e.g., "Matches have not been added yet")
-            for game_name, game_data in all_matches.items():
-                if filter_game and game_name.lower() != filter_game.lower():
-                    continue
-                if isinstance(game_data, dict) and "message" in game_data:
-                    filtered_matches[game_name] = game_data
+            for game_name, message in messages:
+                if is_not_found_result({"message": message}):
+                    if game_name not in failed_games:
+                        failed_games.append(game_name)
+                else:
+                    filtered_matches[game_name] = {"message": message}
 
             # Prepare response
-            response = {
-                "message": "All match data retrieved successfully",
-                "data": filtered_matches,
-                "pagination": {
+            if keyset:
+                pagination = {
+                    "per_page": per_page,
+                    "total": total_matches,
+                    "next_cursor": next_cursor
+                }
+            else:
+                pagination = {
                     "page": page,
                     "per_page": per_page,
                     "total": total_matches,
                     "pages": (total_matches + per_page - 1) // per_page
-                },
+                }
+            response = {
+                "message": "All match data retrieved successfully",
+                "data": filtered_matches,
+                "pagination": pagination,
                 "failed_games": failed_games
             }
 
@@ -1923,7 +2377,7 @@ def setup_routes(app):
         500:
             description: Server error while fetching prize distribution data
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('ewc_page')
         page = max(1, request.args.get('page', 1, type=int))
         per_page = max(1, min(100, request.args.get('per_page', 10, type=int)))
         filter_query = request.args.get('filter', '').strip()
@@ -2004,125 +2458,43 @@ def setup_routes(app):
             return jsonify({"error": "Invalid date format. Expected YYYY-MM-DD"}), 400
 
         try:
-            # Try to load from cached JSON file
-            try:
-                with open('all_matches_EWC.json', 'r', encoding='utf-8') as f:
-                    all_matches = json.load(f)
-                logger.debug("Retrieved all matches from all_matches_EWC.json")
-            except FileNotFoundError:
-                logger.warning("Cached all_matches_EWC.json not found, fetching live data")
+            if not PRECOMPUTED and not has_stored_matches() and not import_all_matches_json():
+                logger.warning("No stored matches, fetching live data")
                 try:
-                    with open('events_ewc.json', 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                    logger.debug("Retrieved events data from events_ewc.json")
-                except FileNotFoundError:
-                    logger.warning("events_ewc.json not found, fetching events from Liquipedia")
-                    games = get_events_ewc(live=True)
-                    if not games:
-                        logger.error("No events data available from Liquipedia")
-                        return jsonify({"error": "No events data available"}), 500
-                    # Save fetched events to JSON file for future caching
-                    try:
-                        with open('events_ewc.json', 'w', encoding='utf-8') as f:
-                            json.dump(games, f, ensure_ascii=False, indent=2)
-                        logger.debug("Saved events data to events_ewc.json")
-                    except Exception as e:
-                        logger.error(f"Error saving events_ewc.json: {str(e)}")
+                    games = load_events_json()
                 except json.JSONDecodeError as e:
                     logger.error(f"Error decoding events_ewc.json: {str(e)}")
                     return jsonify({"error": f"Error decoding events data: {str(e)}"}), 500
+                if not games:
+                    logger.error("No events data available from Liquipedia")
+                    return jsonify({"error": "No events data available"}), 500
 
-                all_matches = {}
-                for game in games:
-                    game_name = game['name']
-                    game_link = game['link']
-                    logger.debug(f"Fetching matches for: {game_name}")
-                    all_matches[game_name] = scrape_group_stage(game_name, game_link)
-                
-                # Save to JSON file for caching
-                try:
-                    with open('all_matches_EWC.json', 'w', encoding='utf-8') as f:
-                        json.dump(all_matches, f, ensure_ascii=False, indent=2)
-                    logger.debug("Saved all matches to all_matches_EWC.json")
-                except Exception as e:
-                    logger.error(f"Error saving all_matches_EWC.json: {str(e)}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Error decoding all_matches_EWC.json: {str(e)}")
-                return jsonify({"error": f"Error decoding cached data: {str(e)}"}), 500
-
-            matches_by_day = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-            for game_name, game_data in all_matches.items():
-                if isinstance(game_data, dict) and "message" in game_data:
-                    matches_by_day["Unknown Date"][game_name]["Unknown Group"] = game_data
-                    continue
+                refresh_all_matches(games)
 
-                for group_name, matches in game_data.items():
-                    for match in matches:
-                        match_time = match.get('MatchTime', 'N/A')
-                        try:
-                            date_str = ' '.join(match_time.split(' - ')[0].split()[:3]) if ' - ' in match_time else match_time
-                            parsed_date = dt.strptime(date_str, '%B %d, %Y')
-                            match_date = parsed_date.strftime('%Y-%m-%d')
-                        except (IndexError, ValueError):
-                            match_date = "Unknown Date"
-
-                        if filter_date and match_date != filter_date:
-                            continue
+            conn = get_db()
+            cursor = conn.cursor()
+            cursor.execute('SELECT game, message FROM match_games WHERE message IS NOT NULL')
+            messages = cursor.fetchall()
 
-                        match_info = {
-                            "Team1": match.get("Team1", {"Name": "N/A", "Logo": "N/A"}),
-                            "Team2": match.get("Team2", {"Name": "N/A", "Logo": "N/A"}),
-                            "MatchTime": match_time,
-                            "Score": match.get("Score", "N/A"),
-                            "_sort_time": parse_match_datetime(match_time)
-                        }
+            matches_by_day = defaultdict(lambda: defaultdict(dict))
+            for game_name, message in messages:
+                matches_by_day[UNKNOWN_MATCH_DATE][game_name]["Unknown Group"] = {"message": message}
 
-                        matches_by_day[match_date][game_name][group_name].append(match_info)
+            where, params = ('match_date = ?', [filter_date]) if filter_date else ('1=1', [])
+            # Rows come sorted by match time, so every group keeps that order
+            for row in select_matches(where, params):
+                groups = matches_by_day[row[8]][row[0]]
+                groups.setdefault(row[1], []).append(row_to_match(row))
 
             formatted_data = {}
-            date_groups = []
-            for date in matches_by_day.keys():
-                try:
-                    parsed_date = dt.strptime(date, '%Y-%m-%d') if date != "Unknown Date" else dt.max
-                    games = {}
-                    for game_name in sorted(matches_by_day[date].keys()):
-                        groups = {}
-                        for group_name in sorted(matches_by_day[date][game_name].keys()):
-                            if isinstance(matches_by_day[date][game_name][group_name], dict):
-                                groups[group_name] = matches_by_day[date][game_name][group_name]
-                            else:
-                                sorted_matches = sorted(
-                                    matches_by_day[date][game_name][group_name],
-                                    key=lambda x: x['_sort_time']
-                                )
-                                groups[group_name] = [
-                                    {k: v for k, v in match.items() if k != '_sort_time'}
-                                    for match in sorted_matches
-                                ]
-                        games[game_name] = groups
-                    date_groups.append((parsed_date, date, games))
-                except ValueError:
-                    games = {}
-                    for game_name in sorted(matches_by_day[date].keys()):
-                        groups = {}
-                        for group_name in sorted(matches_by_day[date][game_name].keys()):
-                            if isinstance(matches_by_day[date][game_name][group_name], dict):
-                                groups[group_name] = matches_by_day[date][game_name][group_name]
-                            else:
-                                sorted_matches = sorted(
-                                    matches_by_day[date][game_name][group_name],
-                                    key=lambda x: x['_sort_time']
-                                )
-                                groups[group_name] = [
-                                    {k: v for k, v in match.items() if k != '_sort_time'}
-                                    for match in sorted_matches
-                                ]
-                        games[game_name] = groups
-                    date_groups.append((dt.max, date, games))
-
-            date_groups.sort(key=lambda x: x[0])
-            for _, date_str, games in date_groups:
-                formatted_data[date_str] = games
+            for date in sorted(matches_by_day, key=lambda d: (d == UNKNOWN_MATCH_DATE, d)):
+                formatted_data[date] = {
+                    game_name: {
+                        group_name: matches_by_day[date][game_name][group_name]
+                        for group_name in sorted(matches_by_day[date][game_name])
+                    }
+                    for game_name in sorted(matches_by_day[date])
+                }
 
             logger.debug(f"Successfully retrieved all EWC match data by day{' on ' + filter_date if filter_date else ''}")
             return jsonify({
@@ -2151,7 +2523,7 @@ def setup_routes(app):
         500:
             description: Server error while fetching games data
         """
-        live = request.args.get('live', 'false').lower() == 'true'
+        live = requested_live('ewc_page')
         
         try:
             games_data = get_ewc_games(live=live)
@@ -2179,13 +2551,35 @@ def create_app():
     CORS(app, resources={r"/api/*": {"origins": "*"}})
     
     app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+    app.teardown_appcontext(release_db)
     
     init_db()
+
+    # With a scheduler, expired Liquipedia caches are served as they are until it refreshes them
+    liquipedia_scraper.revalidate_on_read = not PRECOMPUTED
+    if REFRESH_MODE == 'thread':
+        scheduler.start()
     
     @app.route('/')
     def home():
         return jsonify({"message": "Welcome to Liquipedia Scraper API"})
 
+    @app.route('/api/metrics', methods=['GET'])
+    def get_metrics():
+        """
+        Get request coalescing counters since startup
+        ---
+        responses:
+          200:
+            description: Scrapes executed and requests that shared an in-flight scrape, in total and per operation
+        """
+        return jsonify({
+            "coalescing": {
+                "ewc": scrape_flight.stats(),
+                "liquipedia": liquipedia_scraper.coalescing_stats()
+            }
+        })
+
     @app.route('/api/tournaments', methods=['POST'])
     def get_tournaments():
         data = request.get_json()
@@ -2195,6 +2589,10 @@ def create_app():
         if not game_slug:
             return jsonify({"error": "Missing 'game' in request body"}), 400
 
+        if PRECOMPUTED and force:
+            request_refresh('liquipedia')
+            force = False
+
         result = fetch_tournaments(game_slug, force=force)
         return jsonify(result)
 
@@ -2207,7 +2605,11 @@ def create_app():
         if not game_slug:
             return jsonify({"error": "Missing 'game' in request body"}), 400
 
-        result = get_matches_by_status(game_slug, force=force)
+        if PRECOMPUTED and force:
+            request_refresh('liquipedia')
+            force = False
+
+        result = get_matches_by_status(game_slug, force=force, ttl=matches_cache_ttl)
         return jsonify(result)
     
     setup_routes(app)
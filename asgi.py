@@ -0,0 +1,102 @@
+"""ASGI entry point: serves the same routes and JSON as app.py under uvicorn (see requirements.txt).
+
+    uvicorn asgi:application
+
+Connections are accepted and read on the event loop; each request then runs its blocking Flask
+view on a pool of ASGI_MAX_THREADS threads, so one process keeps hundreds of requests in flight
+instead of one per sync worker. Their Liquipedia requests queue for the HTTP_POOL_SIZE kept-alive
+connections of scraper.http_client instead of each opening its own.
+"""
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app
+
+ASGI_MAX_THREADS = int(os.environ.get('ASGI_MAX_THREADS', 256))
+
+executor = ThreadPoolExecutor(max_workers=ASGI_MAX_THREADS, thread_name_prefix='asgi')
+
+
+def build_environ(scope, body):
+    """WSGI environ of an ASGI http scope and its request body"""
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': (scope.get('client') or ('', 0))[0],
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_LENGTH':
+            continue
+        key = name if name == 'CONTENT_TYPE' else f'HTTP_{name}'
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+def run_wsgi(environ):
+    """Call the Flask app on a pool thread; return its status code, headers and whole body"""
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started['status'] = int(status.split(' ', 1)[0])
+        started['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+    result = app(environ, start_response)
+    try:
+        body = b''.join(result)
+    finally:
+        if hasattr(result, 'close'):
+            result.close()
+    return started['status'], started['headers'], body
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def application(scope, receive, send):
+    """ASGI callable serving the Flask app"""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    body = await read_body(receive)
+    if body is None:
+        return
+    loop = asyncio.get_running_loop()
+    status, headers, content = await loop.run_in_executor(executor, run_wsgi, build_environ(scope, body))
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': content})
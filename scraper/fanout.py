@@ -0,0 +1,45 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+# Upper bound on concurrent scrapes for one fan-out
+MAX_WORKERS = int(os.environ.get("SCRAPER_MAX_WORKERS", 8))
+# Minimum spacing between two requests to the same host (seconds). Liquipedia asks API users for
+# about one page request every 2 seconds, so a fan-out over many pages of one host takes at least
+# that spacing times the number of requests, however fast each game is.
+HOST_MIN_INTERVAL = float(os.environ.get("SCRAPER_HOST_MIN_INTERVAL", 2))
+
+
+class HostRateLimiter:
+    """Space out request starts to the same host by at least min_interval seconds"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until a request to url's host may start"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+host_limiter = HostRateLimiter(HOST_MIN_INTERVAL)
+
+
+def fan_out(func, items, max_workers=None):
+    """Call func on every item with bounded concurrency and return the results in input order"""
+    items = list(items)
+    if not items:
+        return []
+
+    workers = min(max_workers or MAX_WORKERS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
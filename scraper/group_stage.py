@@ -0,0 +1,103 @@
+import sys
+
+from bs4 import Tag
+
+BASE_URL = "https://liquipedia.net"
+UNKNOWN_GROUP = "Unknown Group"
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class MatchRecord:
+    """One group stage match, as parsed and as written to the match store by store_group_stage()
+
+    Fields are interned: team names, logo URLs, times and scores repeat across matches and games,
+    so every record refers to one shared copy of each.
+    """
+
+    __slots__ = ("team1", "logo1", "team2", "logo2", "match_time", "score")
+
+    def __init__(self, team1="N/A", logo1="N/A", team2="N/A", logo2="N/A", match_time="N/A", score="N/A"):
+        self.team1 = _intern(team1)
+        self.logo1 = _intern(logo1)
+        self.team2 = _intern(team2)
+        self.logo2 = _intern(logo2)
+        self.match_time = _intern(match_time)
+        self.score = _intern(score)
+
+    @classmethod
+    def from_json(cls, match):
+        """Record of a match in the public JSON shape, e.g. from a legacy all_matches_EWC.json"""
+        team1 = match.get("Team1", {})
+        team2 = match.get("Team2", {})
+        return cls(
+            team1.get("Name", "N/A"), team1.get("Logo", "N/A"),
+            team2.get("Name", "N/A"), team2.get("Logo", "N/A"),
+            match.get("MatchTime", "N/A"), match.get("Score", "N/A"),
+        )
+
+
+class _MatchParts:
+    __slots__ = ("opponents", "match_time", "score")
+
+    def __init__(self):
+        self.opponents = []  # [aria-label, first img src] per opponent
+        self.match_time = None
+        self.score = None
+
+    def record(self):
+        team1 = team2 = logo1 = logo2 = "N/A"
+        if len(self.opponents) == 2:
+            (team1, src1), (team2, src2) = self.opponents
+            logo1 = BASE_URL + src1 if src1 is not None else "N/A"
+            logo2 = BASE_URL + src2 if src2 is not None else "N/A"
+        return MatchRecord(
+            team1, logo1, team2, logo2,
+            "N/A" if self.match_time is None else self.match_time,
+            "N/A" if self.score is None else self.score,
+        )
+
+
+def _walk(tag, box, match, opponent):
+    """Visit every tag under tag once, filling box (title, matches) and the current match and opponent"""
+    for child in tag.contents:
+        if not isinstance(child, Tag):
+            continue
+        classes = child.get("class") or ()
+
+        if match is None:
+            if "brkts-matchlist-match" in classes:
+                match = _MatchParts()
+                box[1].append(match)
+                _walk(child, box, match, None)
+                match = None
+            elif "brkts-matchlist-title" in classes and box[0] is None:
+                box[0] = child.get_text().strip()
+            else:
+                _walk(child, box, None, None)
+            continue
+
+        if "brkts-matchlist-opponent" in classes:
+            current = [child.get("aria-label", "N/A"), None]
+            match.opponents.append(current)
+            _walk(child, box, match, current)
+        elif "brkts-matchlist-score" in classes and match.score is None:
+            match.score = child.get_text().strip()
+        elif child.name == "span" and "timer-object" in classes and match.match_time is None:
+            match.match_time = child.get_text().strip()
+        else:
+            if opponent is not None and opponent[1] is None and child.name == "img":
+                opponent[1] = child.get("src")
+            _walk(child, box, match, opponent)
+
+
+def parse_group_stage(soup):
+    """Extract {group name: [MatchRecord]} from a parsed Group_Stage page in one pass over each group box"""
+    data = {}
+    for group in soup.find_all("div", class_="template-box"):
+        box = [None, []]
+        _walk(group, box, None, None)
+        data[UNKNOWN_GROUP if box[0] is None else box[0]] = [parts.record() for parts in box[1]]
+    return data
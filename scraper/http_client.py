@@ -0,0 +1,98 @@
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from scraper.fanout import host_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+}
+
+# (connect, read) timeouts in seconds
+CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", 5))
+READ_TIMEOUT = float(os.environ.get("HTTP_READ_TIMEOUT", 20))
+
+MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 3))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Longest Retry-After honoured; a server asking for a longer wait gets its response back unretried
+RETRY_AFTER_MAX = float(os.environ.get("HTTP_RETRY_AFTER_MAX", 120))
+
+# Connections per host; should cover SCRAPER_MAX_WORKERS. More concurrent requests than this (e.g. the
+# ASGI_MAX_THREADS threads of asgi.py) wait for a free connection rather than open throwaway ones.
+POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", 16))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled session used for every Liquipedia request"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, pool_block=True)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+
+def _retry_after(response):
+    """Seconds to wait according to the Retry-After header, or None"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt):
+    """Full-jitter exponential backoff for the given retry attempt"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def get(url, headers=None, timeout=None, retries=None, **kwargs):
+    """GET url through the shared session, retrying 429/5xx responses and connection errors with backoff"""
+    session = get_session()
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    retries = MAX_RETRIES if retries is None else retries
+
+    for attempt in range(retries + 1):
+        host_limiter.wait(url)
+        try:
+            response = session.get(url, headers=headers, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            delay = _backoff(attempt)
+            logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.2f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+            delay = _retry_after(response)
+            if delay is not None and delay > RETRY_AFTER_MAX:
+                logger.warning(f"Request to {url} returned {response.status_code} with Retry-After {delay:.0f}s, giving up")
+                return response
+            delay = _backoff(attempt) if delay is None else delay
+            response.close()
+            logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.2f}s")
+        time.sleep(delay)
@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# Parsed files kept in memory; the least recently used is evicted first
+JSON_CACHE_SIZE = int(os.environ.get("JSON_CACHE_SIZE", 8))
+
+
+class LRUCache:
+    """Thread-safe mapping that keeps at most maxsize entries, evicting the least recently used"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = LRUCache(JSON_CACHE_SIZE)
+
+
+def load_json(path):
+    """Load a JSON file, reusing the result until the file's mtime or size changes
+
+    The returned object is shared between callers and must not be mutated.
+    Raises FileNotFoundError and json.JSONDecodeError like json.load would.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = os.path.abspath(path)
+
+    entry = _cache.get(key)
+    if entry and entry[0] == signature:
+        return entry[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    _cache.set(key, (signature, data))
+    return data
@@ -1,38 +1,184 @@
 import os
 import json
+import logging
+import threading
 import time
-import requests
-from bs4 import BeautifulSoup
+from scraper import http_client
+from scraper.json_cache import LRUCache
+from scraper.parsing import make_soup, TOURNAMENT_LISTS, MATCH_SECTIONS
+from scraper.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 CACHE_DIR = "cache"
 CACHE_DURATION = 10 * 60  # 10 دقائق
+# 4xx answers (e.g. an unknown game slug) are served again for ERROR_CACHE_DURATION seconds.
+# They stay in memory: a cache file would make cached_game_slugs() keep refreshing the slug.
+ERROR_CACHE_DURATION = 60
+ERROR_CACHE_SIZE = 256
+
+# Readers kick off a background refresh of expired files; turned off when a
+# scheduler keeps the cache fresh, so requests only ever read
+revalidate_on_read = True
+
+# One upstream refresh per cache file, however many requests ask for it
+_refresh_flight = SingleFlight()
+_background_refreshes = set()
+_background_lock = threading.Lock()
+# Cache path -> (answered at, error result) of its last 4xx answer
+_errors = LRUCache(ERROR_CACHE_SIZE)
+
+def _read_cache(cache_path):
+    with open(cache_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _meta_path(cache_path):
+    # Validators (ETag / Last-Modified) live next to the cached data
+    return cache_path[:-len(".json")] + ".meta.json"
+
+def _dump_atomic(path, data, **kwargs):
+    # Readers may be serving the stale file while it is refreshed
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp_path, path)
+
+def _write_cache(cache_path, data, response):
+    _dump_atomic(cache_path, data, ensure_ascii=False, indent=2)
+
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    _dump_atomic(_meta_path(cache_path), meta)
+
+def _conditional_headers(cache_path):
+    """If-None-Match / If-Modified-Since headers for revalidating an existing cache file"""
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        meta = _read_cache(_meta_path(cache_path))
+    except (OSError, ValueError):
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+def _revalidate(cache_path, url, parse, error_message):
+    """Revalidate cache_path against url and only re-parse the page when it changed"""
+    response = http_client.get(url, headers=_conditional_headers(cache_path))
+    if response.status_code == 304:
+        # Unchanged upstream: keep the cached data and restart its freshness window
+        os.utime(cache_path, None)
+        return _read_cache(cache_path)
+    if response.status_code != 200:
+        result = {"error": f"{error_message} Status: {response.status_code}"}
+        # 429 and 5xx were already retried and say nothing lasting about the page
+        if 400 <= response.status_code < 500 and response.status_code != 429:
+            _errors.set(cache_path, (time.time(), result))
+        return result
+
+    _errors.pop(cache_path)
+    data = parse(response.content)
+    _write_cache(cache_path, data, response)
+    return data
 
-def fetch_tournaments(game_slug, force=False):
+def _refresh(cache_path, url, parse, error_message):
+    kind = os.path.basename(cache_path).rsplit("_", 1)[-1].split(".")[0]
+    return _refresh_flight.do((kind, cache_path), lambda: _revalidate(cache_path, url, parse, error_message))
+
+def coalescing_stats():
+    """Cache refreshes run and shared since startup, per cache kind (tournaments, matches)"""
+    return _refresh_flight.stats()
+
+def _refresh_in_background(cache_path, url, parse, error_message):
+    with _background_lock:
+        if cache_path in _background_refreshes:
+            return
+        _background_refreshes.add(cache_path)
+
+    def run():
+        try:
+            _refresh(cache_path, url, parse, error_message)
+        except Exception as e:
+            logger.error(f"Background refresh of {url} failed: {str(e)}")
+        finally:
+            with _background_lock:
+                _background_refreshes.discard(cache_path)
+
+    threading.Thread(target=run, daemon=True).start()
+
+def _ttl_for(ttl, data):
+    """Freshness window in seconds: CACHE_DURATION, a fixed number, or ttl(data) for adaptive policies"""
+    if ttl is None:
+        return CACHE_DURATION
+    return ttl(data) if callable(ttl) else ttl
+
+def cached_scrape(cache_path, url, parse, error_message, force=False, ttl=None, wait_if_stale=False):
+    """Serve cache_path, refreshing it from url when it expires (stale-while-revalidate)
+
+    An expired file is returned immediately while one background refresh runs, unless
+    wait_if_stale is set. Callers with no cache to fall back on (or force=True) wait for a
+    single shared refresh. ttl is passed to _ttl_for() with the cached data. A 4xx answer is
+    returned again without asking upstream for ERROR_CACHE_DURATION seconds.
+    """
     os.makedirs(CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(CACHE_DIR, f"{game_slug}_tournaments.json")
 
     if not force and os.path.exists(cache_path):
-        last_modified = os.path.getmtime(cache_path)
-        if time.time() - last_modified < CACHE_DURATION:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-
-    data = scrape_from_liquipedia(game_slug)
-
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    return data
-
-def scrape_from_liquipedia(game_slug):
+        try:
+            data = _read_cache(cache_path)
+        except (OSError, ValueError):
+            data = None
+        if data is not None:
+            age = time.time() - os.path.getmtime(cache_path)
+            if age < _ttl_for(ttl, data):
+                return data
+            if wait_if_stale:
+                return _refresh(cache_path, url, parse, error_message)
+            if revalidate_on_read:
+                _refresh_in_background(cache_path, url, parse, error_message)
+            return data
+
+    if not force:
+        failed = _errors.get(cache_path)
+        if failed and time.time() - failed[0] < ERROR_CACHE_DURATION:
+            return failed[1]
+    return _refresh(cache_path, url, parse, error_message)
+
+def _cache_path(game_slug, kind):
+    return os.path.join(CACHE_DIR, f"{game_slug}_{kind}.json")
+
+def seconds_until_stale(game_slug, kind, ttl=None):
+    """Seconds before the cache of the given kind for game_slug expires; 0 if it is missing or unreadable"""
+    cache_path = _cache_path(game_slug, kind)
+    try:
+        data = _read_cache(cache_path)
+        age = time.time() - os.path.getmtime(cache_path)
+    except (OSError, ValueError):
+        return 0
+    return max(0, _ttl_for(ttl, data) - age)
+
+def cached_game_slugs(kind):
+    """Game slugs with a cache file of the given kind ("tournaments" or "matches")"""
+    suffix = f"_{kind}.json"
+    try:
+        names = os.listdir(CACHE_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(name[:-len(suffix)] for name in names if name.endswith(suffix))
+
+def fetch_tournaments(game_slug, force=False, ttl=None, wait_if_stale=False):
+    cache_path = _cache_path(game_slug, "tournaments")
     url = f"https://liquipedia.net/{game_slug}/Main_Page"
-    headers = {'User-Agent': 'Mozilla/5.0'}
+    return cached_scrape(cache_path, url, parse_tournaments, "Failed to fetch page.",
+                         force=force, ttl=ttl, wait_if_stale=wait_if_stale)
 
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        return {"error": f"Failed to fetch page. Status: {response.status_code}"}
-
-    soup = BeautifulSoup(response.content, 'html.parser')
+def parse_tournaments(html):
+    soup = make_soup(html, parse_only=TOURNAMENT_LISTS)
     sections = ['Upcoming', 'Ongoing', 'Completed']
     all_data = {}
 
@@ -85,26 +231,14 @@ def scrape_from_liquipedia(game_slug):
 
     return all_data
 
-def get_matches_by_status(game="worldoftanks", force=False):
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(CACHE_DIR, f"{game}_matches.json")
-
-    if not force and os.path.exists(cache_path):
-        last_modified = os.path.getmtime(cache_path)
-        if time.time() - last_modified < CACHE_DURATION:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-
+def get_matches_by_status(game="worldoftanks", force=False, ttl=None, wait_if_stale=False):
+    cache_path = _cache_path(game, "matches")
     url = f"https://liquipedia.net/{game}/Liquipedia:Matches"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
-
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        return {"error": f"Failed to fetch matches. Status: {response.status_code}"}
+    return cached_scrape(cache_path, url, parse_matches, "Failed to fetch matches.",
+                         force=force, ttl=ttl, wait_if_stale=wait_if_stale)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_matches(html):
+    soup = make_soup(html, parse_only=MATCH_SECTIONS)
     all_data = {"upcoming": {}, "completed": {}}
     sections = soup.select('div[data-toggle-area-content]')
 
@@ -153,7 +287,4 @@ def get_matches_by_status(game="worldoftanks", force=False):
 
             all_data[status_key].setdefault(tournament_name, []).append(match_data)
 
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
-
     return all_data
@@ -1,15 +1,11 @@
-import requests
-from bs4 import BeautifulSoup
 import json
+from scraper import http_client
+from scraper.parsing import make_soup, MATCH_SECTIONS
 
 def get_matches_by_status(game="worldoftanks"):
     url = f"https://liquipedia.net/{game}/Liquipedia:Matches"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
-
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = http_client.get(url)
+    soup = make_soup(response.text, parse_only=MATCH_SECTIONS)
 
     all_data = {"upcoming": {}, "completed": {}}
     sections = soup.select('div[data-toggle-area-content]')
@@ -0,0 +1,73 @@
+import calendar
+import re
+from datetime import date
+from functools import lru_cache
+
+# Stored timestamp for matches whose time could not be parsed (9999-12-31), so they sort last
+UNKNOWN_MATCH_TIME = 253402300799
+UNKNOWN_MATCH_DATE = "Unknown Date"
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(calendar.month_name)
+    if name
+}
+
+# UTC offsets in minutes of the zone abbreviations Liquipedia timers print. AST, BST and GST are
+# ambiguous and read the way Liquipedia uses them: Arabia (the EWC pages), British Summer and
+# Gulf time, not Atlantic, Bangladesh or South Georgia. CST and IST are too ambiguous to guess
+# and, like unknown zones, read as UTC; pages can print UTC+H[:MM] instead.
+TIMEZONE_OFFSETS = {
+    "UTC": 0, "GMT": 0, "WET": 0, "WEST": 60, "BST": 60, "CET": 60, "CEST": 120,
+    "EET": 120, "EEST": 180, "MSK": 180, "AST": 180, "GST": 240, "PKT": 300,
+    "WIB": 420, "ICT": 420, "SGT": 480, "PHT": 480, "HKT": 480, "KST": 540, "JST": 540,
+    "AEST": 600, "AEDT": 660, "NZST": 720, "NZDT": 780, "BRT": -180, "EDT": -240,
+    "EST": -300, "CDT": -300, "MDT": -360, "MST": -420, "PDT": -420, "PST": -480,
+}
+
+# "July 8, 2025 - 15:00 AST", "July 8, 2025 - 15:00 UTC+3" or just "August 2, 2025"
+MATCH_TIME_PATTERN = re.compile(
+    r"\s*([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})"
+    r"(\s+-\s+(?:(\d{1,2}):(\d{2})(?:\s+([A-Za-z]+)(?:([+-])(\d{1,2})(?::?(\d{2}))?)?)?)?)?"
+)
+
+
+def timezone_offset(zone, sign=None, hours=None, minutes=None):
+    """UTC offset in minutes of a zone abbreviation, optionally followed by an explicit +H[:MM]"""
+    if sign:
+        offset = int(hours) * 60 + int(minutes or 0)
+        return offset if sign == "+" else -offset
+    return TIMEZONE_OFFSETS.get((zone or "").upper(), 0)
+
+
+@lru_cache(maxsize=8192)
+def parse_match_time(match_time):
+    """(UTC timestamp, local YYYY-MM-DD day) of a Liquipedia match time string
+
+    Unparseable parts give UNKNOWN_MATCH_TIME / UNKNOWN_MATCH_DATE, e.g. "July 8, 2025 - TBD"
+    keeps its day but sorts last. The day is the calendar day printed on the page, so matches
+    stay grouped under the date visitors see.
+    """
+    found = MATCH_TIME_PATTERN.match(match_time) if isinstance(match_time, str) else None
+    month = MONTHS.get(found.group(1).capitalize()) if found else None
+    if month is None:
+        return UNKNOWN_MATCH_TIME, UNKNOWN_MATCH_DATE
+
+    month_name, day, year, time_part, hour, minute, zone, sign, offset_hours, offset_minutes = found.groups()
+    try:
+        day = date(int(year), month, int(day))
+    except ValueError:
+        return UNKNOWN_MATCH_TIME, UNKNOWN_MATCH_DATE
+
+    timestamp = calendar.timegm(day.timetuple())
+    if time_part is not None:
+        if hour is None or int(hour) > 23 or int(minute) > 59:
+            return UNKNOWN_MATCH_TIME, day.isoformat()
+        timestamp += int(hour) * 3600 + int(minute) * 60
+        timestamp -= timezone_offset(zone, sign, offset_hours, offset_minutes) * 60
+    return timestamp, day.isoformat()
+
+
+def match_timestamp(match_time):
+    """UTC timestamp used to order matches; unparseable times sort last"""
+    return parse_match_time(match_time)[0]
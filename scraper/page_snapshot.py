@@ -0,0 +1,38 @@
+import os
+import threading
+import time
+from scraper import http_client
+from scraper.parsing import make_soup
+
+# How long a fetched page is shared between extractors (seconds)
+SNAPSHOT_TTL = int(os.environ.get("PAGE_SNAPSHOT_TTL", 60))
+
+_snapshots = {}
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(url):
+    with _locks_guard:
+        return _locks.setdefault(url, threading.Lock())
+
+
+def get_page_soup(url, parse_only=None, ttl=None):
+    """Return the parsed page for url, downloading and parsing it at most once per ttl seconds
+
+    Every caller of the same url shares one tree, so they must agree on parse_only.
+    """
+    ttl = SNAPSHOT_TTL if ttl is None else ttl
+
+    # One lock per URL so concurrent callers wait for a single fetch
+    with _lock_for(url):
+        snapshot = _snapshots.get(url)
+        if snapshot and time.time() - snapshot[0] < ttl:
+            return snapshot[1]
+
+        response = http_client.get(url)
+        response.raise_for_status()
+        soup = make_soup(response.text, parse_only=parse_only)
+        _snapshots[url] = (time.time(), soup)
+        return soup
+
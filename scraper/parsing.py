@@ -0,0 +1,43 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml is several times faster than html.parser on Liquipedia's large pages
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+def has_class(*names):
+    """Strainer predicate matching a tag that carries any of the given CSS classes"""
+    wanted = set(names)
+
+    def match(value):
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return not wanted.isdisjoint(classes)
+
+    return match
+
+
+def make_soup(markup, parse_only=None):
+    """Parse markup with the fastest available backend, building only the parse_only subtrees"""
+    return BeautifulSoup(markup, PARSER, parse_only=parse_only)
+
+
+# Areas of each page the extractors actually read
+EWC_PAGE_AREAS = SoupStrainer(
+    ["div", "table"],
+    class_=has_class(
+        "fo-nttax-infobox",          # get_ewc_information
+        "table-responsive",          # get_teams_ewc
+        "esports-team-game-list",    # get_events_ewc
+        "prizepool-section-tables",  # get_prize_distribution
+        "wikitable",                 # get_ewc_games
+    ),
+)
+GROUP_STAGE_AREAS = SoupStrainer("div", class_=has_class("template-box"))
+LINKS = SoupStrainer("a")
+TOURNAMENT_LISTS = SoupStrainer(class_=has_class("tournaments-list"))
+MATCH_SECTIONS = SoupStrainer("div", attrs={"data-toggle-area-content": True})
@@ -0,0 +1,17 @@
+def adaptive_interval(start_times, now, live_interval, idle_interval, lead_time, live_window):
+    """Seconds to wait before polling a page again, given the UTC start times of its matches
+
+    Poll every live_interval while a match starts within lead_time or started less than
+    live_window ago. Otherwise sleep until lead_time before the next start, and never longer
+    than idle_interval (also used when no match is scheduled at all).
+    """
+    next_start = None
+    for start in start_times:
+        if start - lead_time <= now <= start + live_window:
+            return live_interval
+        if start > now and (next_start is None or start < next_start):
+            next_start = start
+
+    if next_start is None:
+        return idle_interval
+    return max(live_interval, min(idle_interval, next_start - lead_time - now))
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    def __init__(self, name, func, interval):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.next_run = 0.0
+        self.last_run = None
+        self.last_error = None
+        self.forced = False
+
+    def seconds_until_next(self):
+        interval = self.interval() if callable(self.interval) else self.interval
+        return max(1.0, float(interval))
+
+
+class RefreshScheduler:
+    """Run named refresh jobs forever, each again a given number of seconds after it last finished
+
+    interval may be a callable; it is asked after every run, so a job can speed up or back off.
+    Jobs run one at a time, in the order they become due, on a single thread. A run caused by
+    trigger() calls func(force=True), so the job can skip its own staleness checks.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add(self, name, func, interval):
+        with self._lock:
+            self._jobs[name] = _Job(name, func, interval)
+
+    def trigger(self, name):
+        """Make a job due now and forced, e.g. when a client explicitly asks for fresh data"""
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                return False
+            job.next_run = 0.0
+            job.forced = True
+        self._wake.set()
+        return True
+
+    def status(self):
+        with self._lock:
+            return {
+                job.name: {
+                    "last_run": job.last_run,
+                    "next_run": job.next_run,
+                    "last_error": job.last_error,
+                }
+                for job in self._jobs.values()
+            }
+
+    def run_pending(self):
+        """Run every due job once; return the number of seconds until the next one is due"""
+        while True:
+            now = time.time()
+            with self._lock:
+                due = [job for job in self._jobs.values() if job.next_run <= now]
+                if not due:
+                    upcoming = min((job.next_run for job in self._jobs.values()), default=now + 60)
+                    return max(0.0, upcoming - now)
+                job = min(due, key=lambda j: j.next_run)
+                # Not due again until it has run, whatever happens below
+                job.next_run = float("inf")
+                forced, job.forced = job.forced, False
+
+            started = time.time()
+            try:
+                if forced:
+                    job.func(force=True)
+                else:
+                    job.func()
+                job.last_error = None
+                logger.debug(f"Refreshed {job.name} in {time.time() - started:.2f}s")
+            except Exception as e:
+                job.last_error = str(e)
+                logger.error(f"Scheduled refresh of {job.name} failed: {str(e)}")
+            job.last_run = time.time()
+
+            try:
+                delay = job.seconds_until_next()
+            except Exception as e:
+                logger.error(f"Could not compute the next {job.name} refresh: {str(e)}")
+                delay = 60.0
+            with self._lock:
+                # A trigger() while the job was running keeps it due
+                if job.next_run == float("inf"):
+                    job.next_run = job.last_run + delay
+
+    def run_forever(self):
+        """Block, running jobs as they become due, until stop() is called"""
+        while not self._stopped.is_set():
+            delay = self.run_pending()
+            self._wake.wait(delay)
+            self._wake.clear()
+
+    def start(self):
+        """Run the scheduler on a daemon thread of the current process"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, name="refresh-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
@@ -0,0 +1,63 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution
+
+    Calls are counted in total and, for tuple keys such as (endpoint, game_slug), per key[0].
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+        self._by_kind = {}
+
+    def stats(self):
+        """Executed and coalesced call counts, with the number of calls running now"""
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+                "by_kind": {kind: dict(counts) for kind, counts in self._by_kind.items()},
+            }
+
+    def do(self, key, fn):
+        """Run fn for key, or wait for the identical call already running and share its result"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+            if isinstance(key, tuple):
+                counts = self._by_kind.setdefault(key[0], {"executed": 0, "coalesced": 0})
+                counts["executed" if leader else "coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,82 @@
+"""Parse-time benchmark of the group stage extractor.
+
+    python -m tests.bench_group_stage
+
+Times parse_group_stage() against the select()-based extraction it replaced on every saved
+Group_Stage fixture, then on one synthetic page per EWC game (21, in Liquipedia matchlist markup
+with match popups). Not collected by unittest discovery.
+"""
+import random
+import timeit
+
+from scraper.group_stage import parse_group_stage
+from scraper.parsing import make_soup, GROUP_STAGE_AREAS
+from tests.test_group_stage import GROUP_STAGE_FIXTURES, as_json, load_soup, select_group_stage
+
+EWC_GAMES = 21
+
+
+def synthetic_match(rnd, day):
+    def opponent(n):
+        return (
+            f'<div class="brkts-matchlist-cell brkts-matchlist-opponent" aria-label="Team {n}"><div class="block-team">'
+            f'<span class="team-template-image-icon"><a href="/x/Team_{n}"><img src="/commons/images/thumb/{n}.png"></a>'
+            f'</span><span class="name"><a>Team {n}</a></span></div></div>'
+        )
+
+    def score():
+        return f'<div class="brkts-matchlist-cell brkts-matchlist-score"><div>{rnd.randrange(3)}</div></div>'
+
+    popup = (
+        '<div class="brkts-popup brkts-match-info-popup"><div class="brkts-popup-header-dev">'
+        + ''.join(f'<span class="x{k}"><a>p{k}</a></span>' for k in range(6))
+        + f'</div><div class="brkts-popup-body"><span class="timer-object">July {day}, 2025 - 17:00 '
+        '<abbr data-tz="+3:00">AST</abbr></span>'
+        + ''.join(f'<div class="brkts-popup-body-game"><a>hero{k}</a><img src="/h{k}.png"></div>' for k in range(3))
+        + '</div></div>'
+    )
+    return (
+        f'<div class="brkts-matchlist-match">{opponent(rnd.randrange(99))}{score()}{score()}'
+        f'{opponent(rnd.randrange(99))}{popup}</div>'
+    )
+
+
+def synthetic_page(seed):
+    """A Group_Stage page with 4 to 8 groups of 6 to 15 matches behind a large unrelated table"""
+    rnd = random.Random(seed)
+    boxes = ''.join(
+        f'<div class="template-box"><div class="brkts-matchlist"><div class="brkts-matchlist-title">Group {chr(65 + g)}'
+        '</div>' + ''.join(synthetic_match(rnd, 8 + i % 5) for i in range(6 + seed % 10)) + '</div></div>'
+        for g in range(4 + seed % 5)
+    )
+    return '<html><body><table class="wikitable">' + '<tr><td>x</td></tr>' * 200 + '</table>' + boxes + '</body></html>'
+
+
+def bench(label, func, soups, number):
+    seconds = timeit.timeit(lambda: [func(soup) for soup in soups], number=number) / number
+    print(f"  {label:<24} {seconds * 1000:8.2f} ms")
+
+
+def main(number=5):
+    for name in GROUP_STAGE_FIXTURES:
+        soup = load_soup(name)
+        assert as_json(parse_group_stage(soup)) == select_group_stage(soup)
+        matches = sum(len(matches) for matches in parse_group_stage(soup).values())
+        print(f"{name} ({matches} matches):")
+        bench("select() extraction", select_group_stage, [soup], number * 10)
+        bench("parse_group_stage()", parse_group_stage, [soup], number * 10)
+
+    pages = [synthetic_page(seed) for seed in range(EWC_GAMES)]
+    soups = [make_soup(page, parse_only=GROUP_STAGE_AREAS) for page in pages]
+    for soup in soups:
+        assert as_json(parse_group_stage(soup)) == select_group_stage(soup)
+    matches = sum(len(matches) for soup in soups for matches in parse_group_stage(soup).values())
+    print(f"{EWC_GAMES} synthetic EWC game pages ({matches} matches):")
+    bench("select() extraction", select_group_stage, soups, number)
+    bench("parse_group_stage()", parse_group_stage, soups, number)
+    seconds = timeit.timeit(lambda: [make_soup(page, parse_only=GROUP_STAGE_AREAS) for page in pages], number=number)
+    print(f"  {'soup build (for scale)':<24} {seconds / number * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
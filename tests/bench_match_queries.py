@@ -0,0 +1,130 @@
+"""Benchmark of GET /api/ewc_all_matches on a 100k-match store.
+
+    python -m tests.bench_match_queries [matches]
+
+Fills a temporary match store with synthetic group stages (20 games, 10 groups each) and times
+the route, which filters, sorts and pages in SQL, against the all_matches_EWC.json path it
+replaced: load the JSON, flatten, filter, strptime-sort and slice in Python on every request.
+Not collected by unittest discovery.
+"""
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import timeit
+from datetime import datetime as dt
+
+os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(), "news.db")
+
+import app  # noqa: E402
+from scraper.group_stage import MatchRecord  # noqa: E402
+
+GAMES = 20
+GROUPS = 10
+ZONES = ["AST", "CEST", "UTC+3", "PDT"]
+
+# label -> query string; the legacy path reads the same parameters
+QUERIES = {
+    "first page": {},
+    "one game": {"game": "Game 7"},
+    "game and group": {"game": "Game 7", "group": "Group C"},
+    "one day": {"date": "2025-07-20"},
+    "deep page": {"page": 500, "per_page": 100},
+}
+
+
+def synthetic_store(matches):
+    """{game: {group: [MatchRecord]}} with about `matches` matches in total"""
+    rnd = random.Random(8)
+    per_group = max(1, matches // (GAMES * GROUPS))
+    store = {}
+    for g in range(GAMES):
+        store[f"Game {g}"] = {
+            f"Group {chr(ord('A') + k)}": [
+                MatchRecord(
+                    f"Team {rnd.randrange(300)}", f"/logos/{rnd.randrange(300)}.png",
+                    f"Team {rnd.randrange(300)}", f"/logos/{rnd.randrange(300)}.png",
+                    f"{rnd.choice(['July', 'August'])} {rnd.randrange(1, 29)}, 2025 - "
+                    f"{rnd.randrange(24):02d}:{rnd.choice(['00', '30'])} {rnd.choice(ZONES)}",
+                    f"{rnd.randrange(3)}:{rnd.randrange(3)}",
+                )
+                for _ in range(per_group)
+            ]
+            for k in range(GROUPS)
+        }
+    return store
+
+
+def as_legacy_json(store):
+    return json.dumps({
+        game: {
+            group: [
+                {"Team1": {"Name": m.team1, "Logo": m.logo1}, "Team2": {"Name": m.team2, "Logo": m.logo2},
+                 "MatchTime": m.match_time, "Score": m.score}
+                for m in matches
+            ]
+            for group, matches in groups.items()
+        }
+        for game, groups in store.items()
+    })
+
+
+def parse_match_datetime(match_time):
+    try:
+        if ' - ' in match_time:
+            date_str, time_str = match_time.split(' - ')
+            date_str = ' '.join(date_str.split()[:3])
+            return dt.strptime(f"{date_str} {time_str.split()[0]}", '%B %d, %Y %H:%M')
+        return dt.strptime(' '.join(match_time.split()[:3]), '%B %d, %Y')
+    except (IndexError, ValueError):
+        return dt.max
+
+
+def legacy_page(text, game='', group='', date='', page=1, per_page=10):
+    """One page the way the route built it from all_matches_EWC.json"""
+    found = []
+    for game_name, game_data in json.loads(text).items():
+        if game and game_name.lower() != game.lower():
+            continue
+        for group_name, matches in game_data.items():
+            if group and group_name.lower() != group.lower():
+                continue
+            for match in matches:
+                match_time = match.get('MatchTime', 'N/A')
+                try:
+                    date_str = ' '.join(match_time.split(' - ')[0].split()[:3]) if ' - ' in match_time else match_time
+                    match_date = dt.strptime(date_str, '%B %d, %Y').strftime('%Y-%m-%d')
+                except (IndexError, ValueError):
+                    match_date = "Unknown Date"
+                if date and match_date != date:
+                    continue
+                found.append({"game": game_name, "group": group_name, "match": match,
+                              "_sort_datetime": parse_match_datetime(match_time)})
+    found.sort(key=lambda x: x["_sort_datetime"])
+    start = (page - 1) * per_page
+    return found[start:start + per_page]
+
+
+def main(matches=100_000, number=5):
+    logging.disable(logging.INFO)
+    store = synthetic_store(matches)
+    app.init_db()
+    for game, groups in store.items():
+        app.store_group_stage(game, game.replace(' ', '').lower(), groups)
+    text = as_legacy_json(store)
+    client = app.app.test_client()
+    total = sum(len(m) for groups in store.values() for m in groups.values())
+    print(f"{total} matches, {len(text) / 2 ** 20:.1f} MiB as all_matches_EWC.json; ms per request:")
+
+    for label, params in QUERIES.items():
+        response = client.get('/api/ewc_all_matches', query_string=params)
+        assert response.status_code == 200, response.get_json()
+        sql = timeit.timeit(lambda: client.get('/api/ewc_all_matches', query_string=params), number=number)
+        legacy = timeit.timeit(lambda: legacy_page(text, **params), number=1)
+        print(f"  {label:16} SQL route {sql / number * 1000:9.2f}   JSON + Python sort {legacy * 1000:9.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,111 @@
+"""Mixed news read/write benchmark under a multi-threaded WSGI server.
+
+    python -m tests.bench_news_concurrency [readers] [writers]
+
+Serves the app with werkzeug's threaded server on a temporary database and runs READS reads of
+GET /api/news per reader thread against WRITES form posts per writer thread, first with the
+per-thread tuned connection of get_db(), then with a fresh untuned connection per call (rollback
+journal), the way every view used to connect. Not collected by unittest discovery.
+"""
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import requests
+
+os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(), "news.db")
+
+import app  # noqa: E402
+from werkzeug.serving import make_server  # noqa: E402
+
+READS = 150
+WRITES = 250
+SEED_ROWS = 2000
+
+
+def seed(path):
+    conn = sqlite3.connect(path)
+    app.migrate_db(conn)
+    with conn:
+        conn.executemany(
+            'INSERT INTO news (title, writer, description) VALUES (?, ?, ?)',
+            [(f"Seeded news {i}", f"Writer {i % 40}", "Seeded for the benchmark") for i in range(SEED_ROWS)]
+        )
+    conn.close()
+
+
+def untuned_db():
+    return sqlite3.connect(app.DATABASE)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000 if values else 0
+
+
+def run(base_url, readers, writers):
+    """(seconds, read latencies, write latencies, failed requests)"""
+    reads, writes, failures = [], [], []
+    lock = threading.Lock()
+
+    def client(is_writer, n):
+        session = requests.Session()
+        timings = []
+        for i in range(WRITES if is_writer else READS):
+            started = time.perf_counter()
+            if is_writer:
+                response = session.post(f"{base_url}/api/news", data={
+                    "title": f"Bench {n}-{i}", "writer": f"Bench Writer {n}", "description": "concurrent write",
+                })
+            else:
+                response = session.get(f"{base_url}/api/news", params={"per_page": 20, "page": i % 20 + 1})
+            timings.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                with lock:
+                    failures.append(response.status_code)
+        with lock:
+            (writes if is_writer else reads).extend(timings)
+
+    threads = [threading.Thread(target=client, args=(False, n)) for n in range(readers)]
+    threads += [threading.Thread(target=client, args=(True, n)) for n in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, reads, writes, failures
+
+
+def main(readers=8, writers=2):
+    logging.disable(logging.INFO)
+    server = make_server("127.0.0.1", 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    requests_per_run = readers * READS + writers * WRITES
+    print(f"{readers} readers x {READS} GETs, {writers} writers x {WRITES} POSTs ({requests_per_run} requests):")
+
+    tmp = tempfile.mkdtemp()
+    setups = {
+        "get_db(), WAL, per-thread connection": (os.path.join(tmp, "tuned.db"), app.get_db),
+        "connect per call, rollback journal": (os.path.join(tmp, "untuned.db"), untuned_db),
+    }
+    try:
+        for label, (path, get_db) in setups.items():
+            seed(path)
+            with mock.patch.object(app, "DATABASE", path), mock.patch.object(app, "get_db", get_db):
+                seconds, reads, writes, failures = run(base_url, readers, writers)
+            print(
+                f"  {label:38} {seconds:6.2f} s  read p50/p95 {percentile(reads, .5):6.1f}/{percentile(reads, .95):6.1f} ms"
+                f"  write p50/p95 {percentile(writes, .5):6.1f}/{percentile(writes, .95):6.1f} ms  {len(failures)} failed"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,84 @@
+"""Benchmark of news search: news_fts MATCH against the LIKE scan it replaced.
+
+    python -m tests.bench_news_search [rows]
+
+Fills a temporary database with synthetic news (1M rows by default; filling takes a few minutes)
+and times the first page and the COUNT of GET /api/news?search=... both ways, with the queries
+news_filters() builds. Not collected by unittest discovery.
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import timeit
+from unittest import mock
+
+os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(), "news.db")
+
+import app  # noqa: E402
+
+WORDS = [f"word{i}" for i in range(5000)] + ["falcons", "liquid", "vitality", "spirit", "navi", "faze"]
+# label -> search; LIKE reads two words as one phrase, news_fts as both words anywhere
+SEARCHES = {
+    "word": "word4321",
+    "team name": "falcons",
+    "prefix": "vita",
+    "two words": "falcons spirit",
+    "no match": "zzzz",
+}
+PER_PAGE = 20
+
+
+def fill(conn, rows):
+    rnd = random.Random(11)
+    app.migrate_db(conn)
+    batch = 50_000
+    for start in range(0, rows, batch):
+        with conn:
+            conn.executemany(
+                'INSERT INTO news (title, writer, description) VALUES (?, ?, ?)',
+                [
+                    (' '.join(rnd.choices(WORDS, k=6)), f"Writer {rnd.randrange(200)}", ' '.join(rnd.choices(WORDS, k=30)))
+                    for _ in range(start, min(rows, start + batch))
+                ]
+            )
+
+
+def timed(conn, search, fts):
+    """(page ms, count ms, total) of one search"""
+    with mock.patch.object(app, "news_fts_enabled", fts):
+        filters = app.news_filters(None, search)
+    source, where, params = filters
+    query, page_params = app.news_page_query(filters, 'created_at')
+    page = timeit.timeit(lambda: conn.execute(query, page_params + [PER_PAGE + 1, 0]).fetchall(), number=3) / 3
+    count_query = f'SELECT COUNT(*) FROM {source} WHERE {where}'
+    count = timeit.timeit(lambda: conn.execute(count_query, params).fetchone(), number=3) / 3
+    return page * 1000, count * 1000, conn.execute(count_query, params).fetchone()[0]
+
+
+def main(rows=1_000_000):
+    tmp = tempfile.TemporaryDirectory()
+    conn = sqlite3.connect(os.path.join(tmp.name, "news.db"))
+    for pragma in app.DB_PRAGMAS:
+        conn.execute(pragma)
+    fill(conn, rows)
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'news_fts'").fetchone() is None:
+        print("This SQLite build has no FTS5; nothing to compare")
+        return
+
+    print(f"{rows} news rows; first page of {PER_PAGE} and COUNT, ms:")
+    with mock.patch.object(app, "get_db", lambda: conn):
+        for label, search in SEARCHES.items():
+            fts_page, fts_count, fts_total = timed(conn, search, True)
+            like_page, like_count, like_total = timed(conn, search, False)
+            print(
+                f"  {label:12} {search!r:18} FTS {fts_page:8.1f} + {fts_count:8.1f} ({fts_total} rows)"
+                f"   LIKE {like_page:8.1f} + {like_count:8.1f} ({like_total} rows)"
+            )
+    conn.close()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,86 @@
+"""Parse time and peak memory of make_soup() against a full html.parser tree.
+
+    python -m tests.bench_parsing
+
+Each saved Group_Stage fixture, and a synthetic tournaments and matches page, is padded with
+NAVBOXES navigation blocks the way real Liquipedia pages are, then parsed both ways. Peak memory
+is measured with tracemalloc. Not collected by unittest discovery.
+"""
+import os
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from scraper.group_stage import parse_group_stage
+from scraper.parsing import PARSER, make_soup, GROUP_STAGE_AREAS, MATCH_SECTIONS, TOURNAMENT_LISTS
+from tests.test_group_stage import FIXTURES, GROUP_STAGE_FIXTURES, as_json
+
+NAVBOXES = 3000
+
+
+def navboxes(count):
+    return ''.join(
+        f'<div class="navbox"><table><tr><th><a href="/wiki/Page_{i}">Page {i}</a></th>'
+        f'<td><ul><li><a href="/a{i}">A</a></li><li><a href="/b{i}">B</a></li></ul></td></tr></table></div>'
+        for i in range(count)
+    )
+
+
+def tournaments_page():
+    items = ''.join(
+        f'<li><span class="tournament-name"><a href="/dota2/T{i}">Tournament {i}</a></span>'
+        f'<small class="tournaments-list-dates">Jul {i % 28 + 1}</small></li>'
+        for i in range(40)
+    )
+    return (
+        '<div class="tournaments-list"><span class="tournaments-list-heading">Upcoming</span>'
+        f'<ul class="tournaments-list-type-list">{items}</ul></div>'
+    )
+
+
+def matches_page():
+    match = (
+        '<table class="wikitable match"><tr><td class="team-left"><span class="team-template-text"><a>A</a></span></td>'
+        '<td class="versus"><div class="versus-upper"><span>2</span><span>1</span></div></td>'
+        '<td class="team-right"><span class="team-template-text"><a>B</a></span></td></tr></table>'
+    )
+    return ''.join(f'<div data-toggle-area-content="{area}">{match * 100}</div>' for area in ("1", "2"))
+
+
+def page(body):
+    return f'<html><body><div class="mw-parser-output">{body}</div>{navboxes(NAVBOXES)}</body></html>'
+
+
+def measure(build):
+    """(seconds, peak MiB, result) of one build() call"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def main():
+    pages = []
+    for name in GROUP_STAGE_FIXTURES:
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            pages.append((name, page(f.read()), GROUP_STAGE_AREAS))
+    pages.append(("synthetic tournaments page", page(tournaments_page()), TOURNAMENT_LISTS))
+    pages.append(("synthetic matches page", page(matches_page()), MATCH_SECTIONS))
+
+    print(f"make_soup() backend: {PARSER}; {NAVBOXES} navboxes per page")
+    for name, html, areas in pages:
+        full_seconds, full_peak, full = measure(lambda: BeautifulSoup(html, "html.parser"))
+        seconds, peak, strained = measure(lambda: make_soup(html, parse_only=areas))
+        if areas is GROUP_STAGE_AREAS:
+            assert as_json(parse_group_stage(strained)) == as_json(parse_group_stage(full))
+        print(f"{name} ({len(html) / 2 ** 20:.1f} MiB):")
+        print(f"  html.parser, full tree   {full_seconds * 1000:8.1f} ms {full_peak:7.1f} MiB peak")
+        print(f"  make_soup(parse_only)    {seconds * 1000:8.1f} ms {peak:7.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
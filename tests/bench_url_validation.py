@@ -0,0 +1,45 @@
+"""Microbenchmark of the news URL validation helpers.
+
+    python -m tests.bench_url_validation
+
+Not collected by unittest discovery; it prints the mean time per call of each helper.
+"""
+import os
+import tempfile
+import timeit
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import app  # noqa: E402
+
+URLS = {
+    "thumbnail": "https://liquipedia.net/commons/images/thumb/6/66/Team_Spirit_2022_lightmode.png/43px-Team_Spirit_2022_lightmode.png",
+    "news link": "https://www.esportsworldcup.com/en/news/falcons-win-the-club-championship?utm_source=api",
+    "localhost": "http://localhost:5000/uploads/3f2b8c1e.png",
+    "invalid": "ftp://example.com/" + "a" * 200,
+}
+
+
+def bench(label, func, url, number):
+    seconds = timeit.timeit(lambda: func(url), number=number)
+    print(f"{label:<34} {seconds / number * 1e6:8.2f} us")
+
+
+def main(number=20000):
+    uncached = app.is_valid_url.__wrapped__
+    for name, url in URLS.items():
+        print(f"{name}:")
+        bench("  regex match (no memo)", uncached, url, number)
+        app.is_valid_url.cache_clear()
+        bench("  is_valid_url (memoised)", app.is_valid_url, url, number)
+        bench("  is_valid_thumbnail (memoised)", app.is_valid_thumbnail, url, number)
+
+    # Distinct URLs every call: the memo only adds its bookkeeping
+    distinct = [f"https://example.com/news/{i}" for i in range(number)]
+    app.is_valid_url.cache_clear()
+    seconds = timeit.timeit(lambda: [app.is_valid_url(url) for url in distinct], number=1)
+    print(f"{'distinct URLs (memo misses)':<34} {seconds / number * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from urllib.parse import urlencode
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import asgi  # noqa: E402
+
+
+def http_scope(method, path, query=b"", headers=()):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "root_path": "",
+        "query_string": query,
+        "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+        "server": ("testserver", 8000),
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+def run(scope, incoming):
+    """Drive asgi.application with the given receive() messages; return the messages it sent"""
+    sent = []
+    incoming = list(incoming)
+
+    async def receive():
+        if incoming:
+            return incoming.pop(0)
+        # Nothing more from the client: wait like a server would until it goes away
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asyncio.wait_for(asgi.application(scope, receive, send), 30))
+    return sent
+
+
+def request(method, path, query=b"", headers=(), body=b""):
+    """(status, headers dict, body) of one request"""
+    sent = run(http_scope(method, path, query, headers), [{"type": "http.request", "body": body, "more_body": False}])
+    start, content = sent
+    assert start["type"] == "http.response.start" and content["type"] == "http.response.body"
+    headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in start["headers"]}
+    return start["status"], headers, content["body"]
+
+
+class AsgiApplicationTest(unittest.TestCase):
+    def test_get(self):
+        status, headers, body = request("GET", "/")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-type"], "application/json")
+        self.assertEqual(json.loads(body), {"message": "Welcome to Liquipedia Scraper API"})
+
+    def test_query_string(self):
+        status, _, body = request("GET", "/api/news", b"per_page=1&include_total=false")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["pagination"]["per_page"], 1)
+
+    def test_form_post_in_several_chunks(self):
+        form = urlencode({"title": "ASGI bridge", "writer": "Asgi Tester", "description": "sent in two chunks"}).encode()
+        sent = run(
+            http_scope("POST", "/api/news", headers=[
+                ("Content-Type", "application/x-www-form-urlencoded"), ("Content-Length", str(len(form))),
+            ]),
+            [
+                {"type": "http.request", "body": form[:10], "more_body": True},
+                {"type": "http.request", "body": form[10:], "more_body": False},
+            ],
+        )
+        self.assertEqual(sent[0]["status"], 201)
+
+        status, _, body = request("GET", "/api/news", b"writer=asgi&include_total=false")
+        self.assertEqual(status, 200)
+        self.assertEqual([news["title"] for news in json.loads(body)["news"]], ["ASGI bridge"])
+
+    def test_head(self):
+        status, headers, body = request("HEAD", "/")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b"")
+        self.assertEqual(headers["content-type"], "application/json")
+
+    def test_not_found(self):
+        status, _, _ = request("GET", "/no/such/route")
+        self.assertEqual(status, 404)
+
+    def test_client_disconnect(self):
+        with mock.patch.object(asgi, "run_wsgi") as run_wsgi:
+            sent = run(http_scope("POST", "/api/news"), [
+                {"type": "http.request", "body": b"title=", "more_body": True},
+                {"type": "http.disconnect"},
+            ])
+        self.assertEqual(sent, [])
+        run_wsgi.assert_not_called()
+
+    def test_lifespan(self):
+        with mock.patch.object(asgi, "executor") as executor:
+            sent = run({"type": "lifespan"}, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        self.assertEqual([message["type"] for message in sent], ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+        executor.shutdown.assert_called_once()
+
+    def test_environ(self):
+        environ = asgi.build_environ(http_scope("GET", "/café", b"a=1", headers=[
+            ("Accept", "text/html"), ("Accept", "application/json"), ("Content-Type", "text/plain"), ("X-Forwarded-For", "10.0.0.1"),
+        ]), b"xyz")
+        self.assertEqual(environ["PATH_INFO"], "/café".encode("utf-8").decode("latin-1"))
+        self.assertEqual(environ["QUERY_STRING"], "a=1")
+        self.assertEqual(environ["HTTP_ACCEPT"], "text/html,application/json")
+        self.assertEqual(environ["CONTENT_TYPE"], "text/plain")
+        self.assertEqual(environ["CONTENT_LENGTH"], "3")
+        self.assertEqual(environ["HTTP_X_FORWARDED_FOR"], "10.0.0.1")
+        self.assertEqual(environ["wsgi.input"].read(), b"xyz")
+
+
+if __name__ == "__main__":
+    unittest.main()
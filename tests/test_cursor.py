@@ -0,0 +1,60 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import app  # noqa: E402
+
+
+def token(key):
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+class CursorTest(unittest.TestCase):
+    def test_round_trip(self):
+        cursor = app.encode_cursor("title", "Falcons win", 7)
+        self.assertEqual(app.decode_cursor(cursor, "title", (str, int)), ["Falcons win", 7])
+
+    def test_rejects_other_sort(self):
+        cursor = app.encode_cursor("created_at", "2025-07-08 10:00:00", 7)
+        with self.assertRaises(ValueError):
+            app.decode_cursor(cursor, "title", (str, int))
+
+    def test_rejects_wrong_types(self):
+        for key in (
+            [{"a": 1}, 1],
+            ["title", {"a": 1}, 1],
+            ["title", "x", "1"],
+            ["title", "x", True],
+            ["title", "x", None],
+            ["title", "x"],
+            "title",
+        ):
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                app.decode_cursor(token(key), "title", (str, int))
+
+        with self.assertRaises(ValueError):
+            app.decode_cursor(token(["match_time", "July 8", 1]), "match_time", (int, int))
+
+    def test_rejects_garbage(self):
+        for cursor in ("zzz", "e30", "!!", ""):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                app.decode_cursor(cursor, "created_at", (str, int))
+
+    def test_routes_answer_400(self):
+        client = app.app.test_client()
+        news_cursor = app.encode_cursor("created_at", "2025-07-08 10:00:00", 7)
+        for path in (
+            "/api/news?cursor=W3siYSI6MX0sMV0",
+            f"/api/news?sort=title&cursor={news_cursor}",
+            f"/api/ewc_all_matches?cursor={news_cursor}",
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(client.get(path).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import requests  # noqa: E402
+
+import app  # noqa: E402
+from scraper import page_snapshot  # noqa: E402
+from scraper.scheduler import RefreshScheduler  # noqa: E402
+
+
+class EwcPageRefreshTest(unittest.TestCase):
+    """The ewc_page job reports failures in the scheduler status instead of swallowing them"""
+
+    def setUp(self):
+        self.get = mock.Mock()
+        patches = [
+            mock.patch.object(page_snapshot.http_client, "get", self.get),
+            mock.patch.dict(page_snapshot._snapshots, clear=True),
+            mock.patch.object(app.logger, "disabled", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.scheduler = RefreshScheduler()
+        self.scheduler.add("ewc_page", app.refresh_ewc_page, 3600)
+
+    def last_error(self):
+        self.scheduler.run_pending()
+        return self.scheduler.status()["ewc_page"]["last_error"]
+
+    def test_fetch_failure_is_reported(self):
+        self.get.side_effect = requests.ConnectionError("liquipedia is down")
+        self.assertEqual(self.last_error(), "liquipedia is down")
+
+    def test_page_without_the_sections_is_reported(self):
+        self.get.return_value = types.SimpleNamespace(
+            text="<html><body><p>Maintenance</p></body></html>", raise_for_status=lambda: None
+        )
+        error = self.last_error()
+        self.assertIn("get_ewc_information", error)
+        self.assertIn("get_prize_distribution", error)
+        # One download shared by the job and every extractor
+        self.assertEqual(self.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
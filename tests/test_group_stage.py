@@ -0,0 +1,109 @@
+import os
+import unittest
+
+from scraper.group_stage import parse_group_stage
+from scraper.parsing import make_soup, GROUP_STAGE_AREAS
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+GROUP_STAGE_FIXTURES = sorted(name for name in os.listdir(FIXTURES) if name.startswith("group_stage_"))
+
+
+def load_soup(name):
+    """Soup of a fixture, built the way fetch_group_stage() builds it"""
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return make_soup(f.read(), parse_only=GROUP_STAGE_AREAS)
+
+
+def select_group_stage(soup):
+    """The select()-based extraction parse_group_stage() replaced, kept as the reference output"""
+    BASE_URL = "https://liquipedia.net"
+
+    data = {}
+    for group in soup.select('div.template-box'):
+        group_name_tag = group.select_one('.brkts-matchlist-title')
+        group_name = group_name_tag.text.strip() if group_name_tag else 'Unknown Group'
+        matches = []
+
+        for match in group.select('.brkts-matchlist-match'):
+            teams = match.select('.brkts-matchlist-opponent')
+            if len(teams) == 2:
+                team1 = teams[0].get('aria-label', 'N/A')
+                logo1 = BASE_URL + teams[0].select_one('img')['src'] if teams[0].select_one('img') else 'N/A'
+                team2 = teams[1].get('aria-label', 'N/A')
+                logo2 = BASE_URL + teams[1].select_one('img')['src'] if teams[1].select_one('img') else 'N/A'
+            else:
+                team1 = team2 = logo1 = logo2 = 'N/A'
+
+            match_time = match.select_one('span.timer-object')
+            time_text = match_time.text.strip() if match_time else 'N/A'
+
+            score_tag = match.select_one('.brkts-matchlist-score')
+            score = score_tag.text.strip() if score_tag else 'N/A'
+
+            matches.append({
+                "Team1": {"Name": team1, "Logo": logo1},
+                "Team2": {"Name": team2, "Logo": logo2},
+                "MatchTime": time_text,
+                "Score": score
+            })
+
+        data[group_name] = matches
+
+    return data
+
+
+def as_json(data):
+    """parse_group_stage() output in the public JSON shape, as row_to_match() serves it"""
+    return {
+        group: [
+            {
+                "Team1": {"Name": match.team1, "Logo": match.logo1},
+                "Team2": {"Name": match.team2, "Logo": match.logo2},
+                "MatchTime": match.match_time,
+                "Score": match.score,
+            }
+            for match in matches
+        ]
+        for group, matches in data.items()
+    }
+
+
+class ParseGroupStageTest(unittest.TestCase):
+    def test_matches_select_extraction(self):
+        self.assertGreaterEqual(len(GROUP_STAGE_FIXTURES), 3)
+        for name in GROUP_STAGE_FIXTURES:
+            with self.subTest(fixture=name):
+                soup = load_soup(name)
+                self.assertEqual(as_json(parse_group_stage(soup)), select_group_stage(soup))
+
+    def test_edge_cases(self):
+        data = parse_group_stage(load_soup("group_stage_edge_cases.html"))
+        self.assertEqual(list(data), ["Group A", "Unknown Group", "", "Group D"])
+        finished, tbd, single, three = data["Group A"]
+
+        # First score cell, first image of each opponent, first span.timer-object
+        self.assertEqual(
+            (finished.team1, finished.logo1, finished.team2, finished.logo2, finished.score, finished.match_time),
+            ("Team Falcons", "https://liquipedia.net/commons/images/falcons.png",
+             "Team Liquid", "https://liquipedia.net/commons/images/liquid.png", "2", "July 8, 2025 - 17:00 AST"),
+        )
+        self.assertEqual((tbd.team1, tbd.logo1, tbd.match_time, tbd.score), ("TBD", "N/A", "July 10, 2025 - TBD", "N/A"))
+        # Anything but two opponents leaves the teams unknown; only a span counts as the timer
+        self.assertEqual((single.team1, single.team2, single.match_time), ("N/A", "N/A", "N/A"))
+        self.assertEqual((three.team1, three.logo2, three.score), ("N/A", "N/A", ""))
+
+        (unlabelled,) = data["Unknown Group"]
+        self.assertEqual((unlabelled.team1, unlabelled.logo1), ("N/A", "https://liquipedia.net/commons/images/nolabel.png"))
+        self.assertEqual(data[""], [])
+        self.assertEqual(data["Group D"], [])
+
+    def test_fields_are_shared(self):
+        data = parse_group_stage(load_soup("group_stage_round_robin.html"))
+        logos = {}
+        for matches in data.values():
+            for match in matches:
+                self.assertIs(logos.setdefault(match.logo1, match.logo1), match.logo1)
+
+
+if __name__ == "__main__":
+    unittest.main()
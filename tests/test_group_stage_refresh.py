@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import requests  # noqa: E402
+
+import app  # noqa: E402
+from scraper.group_stage import MatchRecord  # noqa: E402
+from scraper.json_cache import LRUCache  # noqa: E402
+
+GAME = {"name": "Test Game", "link": "https://liquipedia.net/testgame/Esports_World_Cup/2025"}
+SLUG = "testgame"
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} Client Error", response=response)
+
+
+class GroupStageRefreshTest(unittest.TestCase):
+    """A failed scrape keeps the stored group stage and is retried soon"""
+
+    def setUp(self):
+        app.store_group_stage(GAME["name"], SLUG, {
+            "Group A": [MatchRecord("Team Spirit", "N/A", "Talon Esports", "N/A", "July 8, 2025 - 12:00 AST", "2:0")],
+        })
+        self.fetch = mock.Mock()
+        patches = [
+            mock.patch.object(app, "load_events_json", return_value=[GAME]),
+            mock.patch.object(app, "get_group_stage_url", side_effect=lambda link: link + "/Group_Stage"),
+            mock.patch.object(app, "fetch_group_stage", self.fetch),
+            mock.patch.dict(app._group_stage_due, clear=True),
+            mock.patch.dict(app._group_stage_failures, clear=True),
+            mock.patch.object(app, "group_stage_scraped", LRUCache(4)),
+            mock.patch.object(app.logger, "disabled", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def stored(self):
+        conn = app.get_db()
+        rows = conn.execute("SELECT team1_name, score FROM matches WHERE game_slug = ?", (SLUG,)).fetchall()
+        message = conn.execute("SELECT message FROM match_games WHERE game_slug = ?", (SLUG,)).fetchone()[0]
+        return rows, message
+
+    def delay(self):
+        return app._group_stage_due[SLUG] - datetime.now().timestamp()
+
+    def test_failures_keep_stored_matches_and_back_off(self):
+        for error in (requests.ConnectionError("down"), http_error(503), ValueError("bad markup")):
+            self.fetch.side_effect = error
+            with self.subTest(error=error):
+                app.refresh_group_stages(force=True)
+                self.assertEqual(self.stored(), ([("Team Spirit", "2:0")], None))
+
+        # 30 s, 60 s, 120 s, capped at REFRESH_LIQUIPEDIA_INTERVAL
+        expected = min(app.REFRESH_LIVE_INTERVAL * 4, app.REFRESH_LIQUIPEDIA_INTERVAL)
+        self.assertAlmostEqual(self.delay(), expected, delta=5)
+        self.assertLess(self.delay(), app.REFRESH_IDLE_INTERVAL)
+
+    def test_success_resets_the_backoff(self):
+        self.fetch.side_effect = requests.ConnectionError("down")
+        app.refresh_group_stages(force=True)
+        app.refresh_group_stages(force=True)
+
+        self.fetch.side_effect = None
+        self.fetch.return_value = {"Group A": [MatchRecord("Team Spirit", "N/A", "Talon Esports", "N/A", "TBD", "1:2")]}
+        app.refresh_group_stages(force=True)
+        self.assertEqual(self.stored(), ([("Team Spirit", "1:2")], None))
+        self.assertNotIn(SLUG, app._group_stage_failures)
+
+        self.fetch.side_effect = requests.ConnectionError("down")
+        app.refresh_group_stages(force=True)
+        self.assertAlmostEqual(self.delay(), app.REFRESH_LIVE_INTERVAL, delta=5)
+
+    def test_missing_page_is_stored_as_a_result(self):
+        self.fetch.side_effect = http_error(404)
+        app.refresh_group_stages(force=True)
+        rows, message = self.stored()
+        self.assertEqual(rows, [])
+        self.assertTrue(app.is_not_found_result({"message": message}))
+
+    def test_per_game_scrapes_are_spaced_including_404s(self):
+        self.fetch.return_value = {}
+        app.scrape_ewc_group_stage(SLUG)
+        app.scrape_ewc_group_stage(SLUG)
+        self.assertEqual(self.fetch.call_count, 1)
+
+        self.fetch.reset_mock()
+        self.fetch.side_effect = http_error(404)
+        for _ in range(3):
+            with self.assertRaises(requests.HTTPError) as raised:
+                app.scrape_ewc_group_stage("nosuchgame")
+            self.assertEqual(raised.exception.response.status_code, 404)
+        self.assertEqual(self.fetch.call_count, 1)
+        # Only the message is remembered, not the error and its page
+        self.assertEqual(app.group_stage_scraped.get("nosuchgame")[1], "404 Client Error")
+
+    def test_per_game_route_fails_the_same_after_a_full_refresh_404(self):
+        self.fetch.side_effect = http_error(404)
+        client = app.app.test_client()
+        with mock.patch.object(app, "PRECOMPUTED", False):
+            app.refresh_group_stages(force=True)
+            remembered = client.post("/api/ewc_matches", json={"game": SLUG})
+            with mock.patch.object(app, "GROUP_STAGE_CACHE_TTL", 0):
+                scraped = client.post("/api/ewc_matches", json={"game": SLUG})
+        self.assertEqual(remembered.status_code, 500)
+        self.assertEqual(remembered.get_json(), {"error": "Failed to fetch data: 404 Client Error"})
+        self.assertEqual((scraped.status_code, scraped.get_json()), (remembered.status_code, remembered.get_json()))
+        self.assertEqual(self.fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
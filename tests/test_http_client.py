@@ -0,0 +1,136 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import types
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+from scraper import http_client
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers each request with the next scripted (status, headers) of its server, then 200"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.client_address[1])
+            action = server.script.pop(0) if server.script else (200, {})
+
+        if action == "drop":
+            # Close the socket without answering, as a dead upstream would
+            self.close_connection = True
+            return
+
+        status, headers = action
+        body = b"ok"
+        time.sleep(server.delay)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class HttpClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.script = []
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/page"
+
+        # A fresh session per test, no real backoff sleeps and no host spacing
+        http_client._session = None
+        self.sleeps = []
+        patches = [
+            mock.patch.object(http_client, "time", types.SimpleNamespace(time=time.time, sleep=self.sleeps.append)),
+            mock.patch.object(http_client.host_limiter, "min_interval", 0),
+            mock.patch.object(http_client.logger, "disabled", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        http_client._session = None
+
+    def test_retry_after_is_waited_out(self):
+        self.server.script = [(503, {"Retry-After": "45"})]
+        response = http_client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.sleeps, [45.0])
+
+    def test_retry_after_above_ceiling_gives_up(self):
+        self.server.script = [(503, {"Retry-After": str(int(http_client.RETRY_AFTER_MAX) + 1)})]
+        response = http_client.get(self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_429_and_5xx_back_off_then_succeed(self):
+        self.server.script = [(429, {}), (500, {}), (502, {})]
+        response = http_client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(len(self.sleeps), 3)
+        for attempt, delay in enumerate(self.sleeps):
+            self.assertLessEqual(delay, http_client.BACKOFF_BASE * 2 ** attempt)
+
+    def test_retries_are_bounded(self):
+        self.server.script = [(503, {})] * 10
+        response = http_client.get(self.url, retries=2)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_non_retryable_status_is_returned(self):
+        self.server.script = [(404, {})]
+        response = http_client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_connection_errors_are_retried(self):
+        self.server.script = ["drop", "drop"]
+        response = http_client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_connection_errors_raise_after_retries(self):
+        self.server.script = ["drop"] * 10
+        with self.assertRaises(requests.ConnectionError):
+            http_client.get(self.url, retries=1)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_pooled_connection_is_reused(self):
+        for _ in range(5):
+            self.assertEqual(http_client.get(self.url).status_code, 200)
+        # Every request arrived from the same client port: one kept-alive connection
+        self.assertEqual(len(set(self.server.requests)), 1)
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_concurrent_requests_share_the_pool(self):
+        self.server.delay = 0.05
+        with mock.patch.object(http_client, "POOL_SIZE", 2), ThreadPoolExecutor(8) as executor:
+            statuses = list(executor.map(lambda _: http_client.get(self.url).status_code, range(16)))
+        self.assertEqual(statuses, [200] * 16)
+        # Threads beyond the pool size waited for a connection instead of opening their own
+        self.assertLessEqual(len(set(self.server.requests)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from scraper import liquipedia_scraper
+from scraper.json_cache import LRUCache
+
+TOURNAMENTS_PAGE = b"""<div class="tournaments-list"><span class="tournaments-list-heading">Upcoming</span>
+<ul class="tournaments-list-type-list"><li><span class="tournament-name"><a href="/dota2/EWC">EWC</a></span></li></ul></div>"""
+
+
+class CachedScrapeTest(unittest.TestCase):
+    def setUp(self):
+        self.responses = []
+        self.calls = []
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patches = [
+            mock.patch.object(liquipedia_scraper, "CACHE_DIR", tmp.name),
+            mock.patch.object(liquipedia_scraper, "_errors", LRUCache(8)),
+            mock.patch.object(liquipedia_scraper.http_client, "get", self.get),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get(self, url, headers=None):
+        self.calls.append(url)
+        status = self.responses.pop(0) if self.responses else 200
+        return types.SimpleNamespace(status_code=status, content=TOURNAMENTS_PAGE, headers={})
+
+    def test_not_found_is_remembered_without_a_cache_file(self):
+        self.responses = [404]
+        for _ in range(3):
+            self.assertEqual(liquipedia_scraper.fetch_tournaments("nosuchgame"), {"error": "Failed to fetch page. Status: 404"})
+        self.assertEqual(len(self.calls), 1)
+        # Not a cache file, so the scheduler does not keep refreshing an unknown slug
+        self.assertEqual(liquipedia_scraper.cached_game_slugs("tournaments"), [])
+
+        with mock.patch.object(liquipedia_scraper, "ERROR_CACHE_DURATION", 0):
+            self.assertEqual(liquipedia_scraper.fetch_tournaments("nosuchgame")["Upcoming"][0]["name"], "EWC")
+        self.assertEqual(len(self.calls), 2)
+        self.assertIsNone(liquipedia_scraper._errors.get(liquipedia_scraper._cache_path("nosuchgame", "tournaments")))
+
+    def test_force_skips_the_remembered_error(self):
+        self.responses = [404]
+        liquipedia_scraper.get_matches_by_status("nosuchgame")
+        self.assertEqual(liquipedia_scraper.get_matches_by_status("nosuchgame", force=True), {"upcoming": {}, "completed": {}})
+        self.assertEqual(len(self.calls), 2)
+
+    def test_rate_limits_and_server_errors_are_not_remembered(self):
+        for status in (429, 500, 503):
+            with self.subTest(status=status):
+                self.calls.clear()
+                self.responses = [status]
+                self.assertIn("error", liquipedia_scraper.fetch_tournaments(f"game{status}"))
+                self.assertNotIn("error", liquipedia_scraper.fetch_tournaments(f"game{status}"))
+                self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
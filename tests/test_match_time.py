@@ -0,0 +1,57 @@
+import calendar
+import unittest
+
+from scraper.match_time import (
+    UNKNOWN_MATCH_DATE, UNKNOWN_MATCH_TIME, match_timestamp, parse_match_time, timezone_offset,
+)
+
+
+def utc(year, month, day, hour=0, minute=0):
+    return calendar.timegm((year, month, day, hour, minute, 0))
+
+
+class ParseMatchTimeTest(unittest.TestCase):
+    def test_zone_abbreviations(self):
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 AST"), (utc(2025, 7, 8, 12), "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 CEST"), (utc(2025, 7, 8, 13), "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 PDT"), (utc(2025, 7, 8, 22), "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 ast"), parse_match_time("July 8, 2025 - 15:00 AST"))
+
+    def test_day_is_the_printed_one(self):
+        # 01:00 in Riyadh is still the previous day in UTC, but the match is listed under July 9
+        self.assertEqual(parse_match_time("July 9, 2025 - 01:00 AST"), (utc(2025, 7, 8, 22), "2025-07-09"))
+
+    def test_explicit_offsets(self):
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 UTC+3"), (utc(2025, 7, 8, 12), "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 UTC+5:30"), (utc(2025, 7, 8, 9, 30), "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 15:00 UTC-4"), (utc(2025, 7, 8, 19), "2025-07-08"))
+        self.assertEqual(timezone_offset("UTC", "-", "3", "30"), -210)
+
+    def test_unknown_and_ambiguous_zones_read_as_utc(self):
+        for zone in ("UTC", "", "XYZ", "CST", "IST"):
+            with self.subTest(zone=zone):
+                text = f"July 8, 2025 - 15:00 {zone}".rstrip()
+                self.assertEqual(parse_match_time(text), (utc(2025, 7, 8, 15), "2025-07-08"))
+
+    def test_date_only(self):
+        self.assertEqual(parse_match_time("August 2, 2025"), (utc(2025, 8, 2), "2025-08-02"))
+
+    def test_tbd_keeps_the_day_and_sorts_last(self):
+        self.assertEqual(parse_match_time("July 8, 2025 - TBD"), (UNKNOWN_MATCH_TIME, "2025-07-08"))
+        self.assertEqual(parse_match_time("July 8, 2025 - 25:00 AST"), (UNKNOWN_MATCH_TIME, "2025-07-08"))
+
+    def test_invalid_values(self):
+        for text in ("February 30, 2025 - 12:00 AST", "Juli 8, 2025 - 12:00 AST", "Smarch 1, 2025", "N/A", "", None):
+            with self.subTest(text=text):
+                self.assertEqual(parse_match_time(text), (UNKNOWN_MATCH_TIME, UNKNOWN_MATCH_DATE))
+
+    def test_unknown_times_sort_last(self):
+        times = ["N/A", "July 9, 2025 - 12:00 AST", "July 8, 2025 - TBD", "July 8, 2025 - 12:00 AST"]
+        self.assertEqual(
+            sorted(times, key=match_timestamp),
+            ["July 8, 2025 - 12:00 AST", "July 9, 2025 - 12:00 AST", "N/A", "July 8, 2025 - TBD"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import itertools
+import os
+import re
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import app  # noqa: E402
+
+WRITERS = ["Omar Ali", "Sara Omar", "Nadia"]
+# More writers matching one filter than a compound SELECT may have terms
+MANY_WRITERS = [f"Ahmed{i}" for i in range(600)]
+
+# writer filter -> writers it resolves to through news_writer_counts
+WRITER_FILTERS = {
+    None: None,
+    "nadia": ["Nadia"],
+    "omar": ["Omar Ali", "Sara Omar"],
+    "nobody": [],
+}
+# search -> whether it runs on news_fts ("!!" has no words, so it falls back to LIKE)
+SEARCHES = {None: False, "falcons": True, "!!": False}
+SORTS = ["created_at", "title", "relevance"]
+# sort column -> suffix of the idx_news_<suffix> and idx_news_writer_<suffix> indexes
+INDEXES = {"created_at": "created", "title": "title"}
+
+
+class NewsQueryPlanTest(unittest.TestCase):
+    """Every filter, sort and cursor combination of GET /api/news reads an index, not the whole table"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.conn = sqlite3.connect(os.path.join(cls.tmp.name, "news.db"))
+        app.migrate_db(cls.conn)
+        fts = cls.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'news_fts'").fetchone() is not None
+        if not fts:
+            raise unittest.SkipTest("SQLite was built without FTS5")
+
+        with cls.conn:
+            cls.conn.executemany(
+                "INSERT INTO news (title, description, writer, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (f"Falcons {i % 7}" if i % 3 else f"Other {i}", "desc", WRITERS[i % 3], f"2025-07-{i % 28 + 1:02d} 10:00:00")
+                    for i in range(300)
+                ] + [
+                    (f"Falcons {i}", "desc", name, f"2025-06-{i % 28 + 1:02d} 10:00:00")
+                    for i, name in enumerate(MANY_WRITERS)
+                ],
+            )
+
+        cls.patches = [
+            mock.patch.object(app._db_local, "conn", cls.conn, create=True),
+            mock.patch.object(app, "news_fts_enabled", True),
+        ]
+        for patch in cls.patches:
+            patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patch in cls.patches:
+            patch.stop()
+        cls.conn.close()
+        cls.tmp.cleanup()
+
+    def combinations(self):
+        for writer, search, sort, keyset in itertools.product(WRITER_FILTERS, SEARCHES, SORTS, (False, True)):
+            if keyset and sort == "relevance":
+                continue  # rejected by the route
+            yield writer, search, sort, ["2025-07-15 10:00:00" if sort != "title" else "Falcons 3", 150] if keyset else None
+
+    def page(self, writer, search, sort, after):
+        filters = app.news_filters(writer or "", search or "")
+        return app.news_page_query(filters, sort, after)
+
+    def plan(self, query, params):
+        return [row[3] for row in self.conn.execute("EXPLAIN QUERY PLAN " + query, params + [11, 0])]
+
+    def test_writer_filters_resolve(self):
+        for writer, expected in WRITER_FILTERS.items():
+            if writer:
+                self.assertEqual(sorted(app.matching_writers(writer)), expected)
+
+    def test_plans(self):
+        for writer, search, sort, after in self.combinations():
+            with self.subTest(writer=writer, search=search, sort=sort, cursor=after is not None):
+                plan = self.plan(*self.page(writer, search, sort, after))
+                column = "created_at" if sort == "relevance" else sort
+                index = INDEXES[column]
+
+                if writer == "nobody":
+                    # The constant false term is checked once before the loop, so no row is read
+                    self.assertIn("0", app.news_filters(writer, search or "")[1].split(" AND "))
+                    continue
+
+                if SEARCHES[search]:
+                    # Either side may drive the join, but news is only ever read through an index
+                    self.assertTrue(any(step.startswith("SCAN news_fts VIRTUAL TABLE") for step in plan), plan)
+                    reads = [step for step in plan if re.match(r"(SCAN|SEARCH) news ", step)]
+                    self.assertTrue(reads, plan)
+                    for step in reads:
+                        self.assertRegex(step, r"^SEARCH news USING (INTEGER PRIMARY KEY \(rowid=\?\)|INDEX idx_news_writer_)")
+                    continue
+
+                self.assertNotIn("SCAN news", plan)
+                self.assertFalse(any("TEMP B-TREE" in step for step in plan), plan)
+                reads = [step for step in plan if step.startswith(("SCAN news", "SEARCH news"))]
+                if writer:
+                    expected = f"SEARCH news USING INDEX idx_news_writer_{index} (writer=?"
+                    self.assertEqual(len(reads), len(WRITER_FILTERS[writer]), plan)
+                else:
+                    expected = f"{'SEARCH' if after else 'SCAN'} news USING INDEX idx_news_{index}"
+                    self.assertEqual(len(reads), 1, plan)
+                for step in reads:
+                    self.assertTrue(step.startswith(expected), plan)
+                    if after:
+                        self.assertIn(f"{column}<?", step)
+
+    def test_results_match_a_plain_filter(self):
+        for writer, search, sort, after in self.combinations():
+            with self.subTest(writer=writer, search=search, sort=sort, cursor=after is not None):
+                query, params = self.page(writer, search, sort, after)
+                ids = [row[0] for row in self.conn.execute(query, params + [-1, 0])]
+
+                column = "created_at" if sort == "relevance" else sort
+                rows = self.conn.execute(f"SELECT id, writer, title, description, {column} FROM news").fetchall()
+                expected = [
+                    row for row in rows
+                    if (writer is None or row[1] in WRITER_FILTERS[writer])
+                    and (search is None or search.lower() in (row[2] + " " + row[3]).lower()
+                         or (SEARCHES[search] and search.lower() in row[2].lower()))
+                    and (after is None or (row[4], row[0]) < tuple(after))
+                ]
+                if sort == "relevance" and SEARCHES[search]:
+                    self.assertEqual(sorted(ids), sorted(row[0] for row in expected))
+                else:
+                    expected.sort(key=lambda row: (row[4], row[0]), reverse=True)
+                    self.assertEqual(ids, [row[0] for row in expected])
+
+    def test_many_writers_fall_back_to_in(self):
+        self.assertGreater(len(MANY_WRITERS), app.WRITER_BRANCHES_MAX)
+        for sort, after in (("created_at", None), ("title", None), ("created_at", ["2025-06-15 10:00:00", 10**6])):
+            with self.subTest(sort=sort, cursor=after is not None):
+                query, params = self.page("ahmed", None, sort, after)
+                self.assertNotIn("UNION ALL", query)
+                self.assertNotIn("MERGE (UNION ALL)", self.plan(query, params))
+
+                ids = [row[0] for row in self.conn.execute(query, params + [-1, 0])]
+                rows = self.conn.execute(
+                    f"SELECT id, {sort} FROM news WHERE writer LIKE 'Ahmed%' ORDER BY {sort} DESC, id DESC"
+                ).fetchall()
+                self.assertEqual(ids, [row[0] for row in rows if after is None or (row[1], row[0]) < tuple(after)])
+
+        client = app.app.test_client()
+        for path in ("/api/news?writer=ahmed", "/api/news?writer=ahmed&include_total=false"):
+            with self.subTest(path=path):
+                self.assertEqual(client.get(path).status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
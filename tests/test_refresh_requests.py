@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "news.db"))
+
+import app  # noqa: E402
+from scraper.scheduler import RefreshScheduler  # noqa: E402
+
+
+class RefreshRequestTest(unittest.TestCase):
+    """In worker mode a web process reaches the worker's scheduler through refresh_requests"""
+
+    def setUp(self):
+        self.runs = []
+        # The worker's scheduler, with every job run once so that none is due
+        self.worker = RefreshScheduler()
+        for name in ("group_stages", "liquipedia"):
+            self.worker.add(name, lambda force=False, name=name: self.runs.append((name, force)), 3600)
+        self.worker.add("refresh_requests", app.run_refresh_requests, 3600)
+
+        patches = [
+            mock.patch.object(app, "REFRESH_MODE", "worker"),
+            mock.patch.object(app, "PRECOMPUTED", True),
+            mock.patch.object(app, "scheduler", self.worker),
+            mock.patch.object(app.logger, "disabled", True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.worker.run_pending()
+        self.runs.clear()
+
+    def poll(self):
+        self.worker._jobs["refresh_requests"].next_run = 0
+        self.worker.run_pending()
+
+    def test_request_is_run_forced_by_the_worker(self):
+        client = app.app.test_client()
+        client.get("/api/ewc_all_matches?live=true")
+        client.get("/api/ewc_all_matches?live=true")
+        self.assertEqual(self.runs, [])
+
+        self.poll()
+        self.assertEqual(self.runs, [("group_stages", True)])
+        self.assertEqual(app.get_db().execute("SELECT COUNT(*) FROM refresh_requests").fetchone()[0], 0)
+
+        self.poll()
+        self.assertEqual(self.runs, [("group_stages", True)])
+
+    def test_unknown_jobs_are_dropped(self):
+        app.request_refresh("no_such_job")
+        app.request_refresh("liquipedia")
+        self.poll()
+        self.assertEqual(self.runs, [("liquipedia", True)])
+        self.assertEqual(app.get_db().execute("SELECT COUNT(*) FROM refresh_requests").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+"""Refresh worker: keeps every dataset fresh in its own process while the web app only reads.
+
+Run it next to the web app, which should then be started with REFRESH_MODE=worker as well:
+
+    REFRESH_MODE=worker python worker.py
+"""
+import os
+
+os.environ.setdefault('REFRESH_MODE', 'worker')
+
+from app import scheduler  # noqa: E402
+
+if __name__ == '__main__':
+    scheduler.run_forever()